@@ -1,18 +1,361 @@
-from nicegui import ui
+from nicegui import run, ui
 from datetime import datetime, date
+from bisect import insort
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+import asyncio
+import html
 import logging
+import re
+from functools import lru_cache
+from types import MappingProxyType
 
 from app.content_service import ContentService, AuthorService, CategoryService
-from app.models import ContentCreate, BookCreate, ContentType
+from app.content_service_cache import (
+    cached_count_authors,
+    cached_count_categories,
+    cached_get_authors_page,
+    cached_get_categories_page,
+    ttl_bucket,
+)
+from app.models import Author, Category, ContentCreate, BookCreate, ContentType
 
 logger = logging.getLogger(__name__)
 
+# Author/category pickers only fetch the rows matching what the user types, capped at this many options
+_PICKER_LIMIT = 50
+_PICKER_PROPS = "input-debounce=300 options-dense virtual-scroll-slice-size=30"
+
+_MIN_TIME = datetime.min.time()
+
+# Read-only option sets and class strings shared by every page render
+_CONTENT_TYPE_OPTIONS = MappingProxyType(
+    {
+        ContentType.BOOK: "Book",
+        ContentType.ARTICLE: "Article",
+        ContentType.MAGAZINE: "Magazine",
+        ContentType.MULTIMEDIA: "Multimedia",
+    }
+)
+_BOOK_FORMATS = ("paperback", "hardcover", "ebook", "audiobook")
+# NiceGUI choice elements take a list or a mapping, so the formats are offered as an identity mapping
+_BOOK_FORMAT_OPTIONS = MappingProxyType({book_format: book_format for book_format in _BOOK_FORMATS})
+_CARD_CLS = "w-full p-6"
+_HEADING_CLS = "text-xl font-semibold text-gray-800 mb-4"
+_FIELD_CLS = "w-full mb-4"
+
+# Author/category grids render this many cards up front and fetch the next page when scrolled near the end
+_LIST_PAGE_SIZE = 60
+_LIST_SCROLL_CLS = "w-full h-[70vh]"
+
+# A comma-separated tag with surrounding whitespace trimmed; blank entries never match
+_TAG_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _refresh_picker_options(select: ui.select, options: Dict[int, str]) -> None:
+    """Replace the options of a search-driven multi-select, keeping already selected entries."""
+    selected = {value: select.options[value] for value in select.value if value in select.options}
+    select.set_options({**options, **selected})
+
+
+def _to_date(value: Optional[str]) -> Optional[date]:
+    """Convert the ISO string of a ui.date widget into a date."""
+    return date.fromisoformat(value) if value else None
+
+
+def _to_ids(value: Optional[List[int]]) -> Tuple[int, ...]:
+    """Convert the value of a multi-select picker into a tuple of ids."""
+    return tuple(value or ())
+
+
+def _author_options(authors: List[Author]) -> Dict[int, str]:
+    return {author.id: f"{author.first_name} {author.last_name}" for author in authors if author.id is not None}
+
+
+def _category_options(categories: List[Category]) -> Dict[int, str]:
+    return {category.id: category.name for category in categories if category.id is not None}
+
+
+def _author_sort_key(author: Author) -> Tuple[str, str, int]:
+    return (author.last_name, author.first_name, author.id or 0)
+
+
+def _category_sort_key(category: Category) -> Tuple[str, int]:
+    return (category.name, category.id or 0)
+
+
+@lru_cache(maxsize=2)
+def _author_seed_options(version: int, bucket: int) -> Mapping[int, str]:
+    """Initial author picker options, rebuilt only when the author version or TTL bucket changes."""
+    return MappingProxyType(_author_options(AuthorService.search_authors("", limit=_PICKER_LIMIT)))
+
+
+@lru_cache(maxsize=2)
+def _category_seed_options(version: int, bucket: int) -> Mapping[int, str]:
+    """Initial category picker options, rebuilt only when the category version or TTL bucket changes."""
+    return MappingProxyType(_category_options(CategoryService.search_categories("", limit=_PICKER_LIMIT)))
+
+
+def _author_card_html(author: Author) -> str:
+    name = html.escape(f"{author.first_name} {author.last_name}")
+    biography = (
+        f'<div class="text-sm text-gray-600 mt-2 line-clamp-3">{html.escape(author.biography)}</div>'
+        if author.biography
+        else ""
+    )
+    return f'<div class="q-card p-4"><div class="text-lg font-semibold text-gray-800">{name}</div>{biography}</div>'
+
+
+def _category_card_html(category: Category) -> str:
+    description = (
+        f'<div class="text-sm text-gray-600 mt-2">{html.escape(category.description)}</div>'
+        if category.description
+        else ""
+    )
+    return (
+        f'<div class="q-card p-4"><div class="text-lg font-semibold text-gray-800">{html.escape(category.name)}</div>'
+        f"{description}</div>"
+    )
+
+
+@dataclass
+class _ListPage:
+    """Paging position of a lazily loaded card grid."""
+
+    total: int = 0
+    offset: int = 0
+    done: bool = False
+    loading: bool = False
+    last_key: Tuple = ()
+    # Rendered html chunks in grid order, each with the (sort key, card html) of the cards it shows
+    chunks: List[Tuple[ui.html, List[Tuple[Tuple, str]]]] = field(default_factory=list)
+
+    def add_chunk(self, grid: ui.element, cards: List[Tuple[Tuple, str]]) -> None:
+        """Render cards after the loaded ones as one html element, instead of a card and labels per row."""
+        with grid:
+            chunk = ui.html("".join(card for _, card in cards)).classes("contents")
+        self.chunks.append((chunk, cards))
+        self.offset += len(cards)
+        self.last_key = cards[-1][0]
+
+    def insert_card(self, grid: ui.element, key: Tuple, card: str) -> None:
+        """Render a new card at its sorted position among the loaded ones."""
+        for chunk, cards in self.chunks:
+            if key < cards[-1][0]:
+                insort(cards, (key, card))
+                chunk.set_content("".join(card for _, card in cards))
+                self.offset += 1
+                return
+        self.add_chunk(grid, [(key, card)])
+
+
+@dataclass
+class _BookFormState:
+    """Typed field values and submit outcome of a book form."""
+
+    selected_authors: Tuple[int, ...] = ()
+    selected_categories: Tuple[int, ...] = ()
+    pub_date: Optional[date] = None
+    author_query: str = ""
+    category_query: str = ""
+    submitting: bool = False
+    created_content_id: Optional[int] = None
+
+
+async def _build_book_form(container: ui.column) -> None:
+    """Create form for adding a book."""
+    state = _BookFormState()
+    with container:
+        # Quasar checks the fields' :rules in the browser and only emits submit once the form is valid
+        with ui.element("q-form").classes("w-full") as book_form, ui.card().classes(_CARD_CLS):
+            ui.label("Book Information").classes(_HEADING_CLS)
+
+            # Basic content fields
+            title_input = (
+                ui.input("Title").classes(_FIELD_CLS).props("""required :rules="[v => !!v || 'Title is required']" """)
+            )
+            description_input = ui.textarea("Description").classes(_FIELD_CLS).props("rows=4")
+            isbn_input = ui.input("ISBN").classes(_FIELD_CLS)
+            language_input = ui.input("Language", value="English").classes(_FIELD_CLS)
+
+            # Publication date
+            ui.label("Publication Date").classes("text-sm text-gray-600")
+            ui.date().classes(_FIELD_CLS).bind_value_to(state, "pub_date", forward=_to_date)
+
+            # Tags
+            tags_input = ui.input("Tags (comma-separated)").classes(_FIELD_CLS)
+
+            # Book-specific fields
+            ui.label("Book Details").classes("text-lg font-semibold text-gray-800 mb-2 mt-4")
+            publisher_input = ui.input("Publisher").classes(_FIELD_CLS)
+            pages_input = ui.number("Page Count", min=1).classes(_FIELD_CLS)
+            edition_input = ui.input("Edition").classes(_FIELD_CLS)
+            format_select = ui.select(options=_BOOK_FORMAT_OPTIONS, value=_BOOK_FORMATS[0], label="Format").classes(
+                _FIELD_CLS
+            )
+
+            # Author selection
+            ui.label("Authors").classes("text-lg font-semibold text-gray-800 mb-2")
+            author_select = (
+                ui.select(options={}, multiple=True, with_input=True, label="Search Authors")
+                .classes(_FIELD_CLS)
+                .props(_PICKER_PROPS)
+                .bind_value_to(state, "selected_authors", forward=_to_ids)
+            )
+
+            async def search_authors(e):
+                """Load authors matching the text typed into the picker."""
+                query = state.author_query = e.args or ""
+                try:
+                    authors = await run.io_bound(AuthorService.search_authors, query, limit=_PICKER_LIMIT)
+                    # A slow response to an earlier keystroke must not replace newer results
+                    if query == state.author_query:
+                        _refresh_picker_options(author_select, _author_options(authors))
+                except Exception as e:
+                    logger.error("Error loading authors: %s", e, exc_info=True)
+                    ui.notify(f"Error loading authors: {str(e)}", type="negative")
+
+            author_select.on("input-value", search_authors)
+
+            # Category selection
+            ui.label("Categories").classes("text-lg font-semibold text-gray-800 mb-2")
+            category_select = (
+                ui.select(options={}, multiple=True, with_input=True, label="Search Categories")
+                .classes("w-full mb-6")
+                .props(_PICKER_PROPS)
+                .bind_value_to(state, "selected_categories", forward=_to_ids)
+            )
+
+            async def search_categories(e):
+                """Load categories matching the text typed into the picker."""
+                query = state.category_query = e.args or ""
+                try:
+                    categories = await run.io_bound(CategoryService.search_categories, query, limit=_PICKER_LIMIT)
+                    if query == state.category_query:
+                        _refresh_picker_options(category_select, _category_options(categories))
+                except Exception as e:
+                    logger.error("Error loading categories: %s", e, exc_info=True)
+                    ui.notify(f"Error loading categories: {str(e)}", type="negative")
+
+            category_select.on("input-value", search_categories)
+
+            # Submit button
+            with ui.row().classes("gap-4 justify-end"):
+                ui.button("Cancel", on_click=lambda: ui.navigate.to("/")).props("outline")
+                ui.button("Add Book", icon="add").props("type=submit").classes("bg-primary text-white")
+
+            async def submit_book():
+                """Submit the book form."""
+                # A repeated click after a successful submit must not create the book twice
+                if state.created_content_id is not None:
+                    ui.navigate.to(f"/content/{state.created_content_id}")
+                    return
+
+                # The title rule is enforced client-side; this only guards against submits bypassing the form
+                if not title_input.value or state.submitting:
+                    return
+
+                state.submitting = True
+                try:
+                    # Parse tags
+                    tags = _TAG_RE.findall(tags_input.value) if tags_input.value else []
+
+                    pub_date = datetime.combine(state.pub_date, _MIN_TIME) if state.pub_date else None
+
+                    # Create content data
+                    content_data = ContentCreate(
+                        title=title_input.value,
+                        description=description_input.value or "",
+                        content_type=ContentType.BOOK,
+                        isbn=isbn_input.value,
+                        language=language_input.value or "English",
+                        publication_date=pub_date,
+                        tags=tags,
+                    )
+
+                    # Create book data
+                    book_data = BookCreate(
+                        publisher=publisher_input.value or "",
+                        page_count=int(pages_input.value) if pages_input.value else None,
+                        edition=edition_input.value or "",
+                        format=format_select.value or _BOOK_FORMATS[0],
+                    )
+
+                    # Create the book
+                    content = await run.io_bound(
+                        ContentService.create_book,
+                        content_data=content_data,
+                        book_data=book_data,
+                        author_ids=list(state.selected_authors) if state.selected_authors else None,
+                        category_ids=list(state.selected_categories) if state.selected_categories else None,
+                    )
+
+                    if content and content.id is not None:
+                        state.created_content_id = content.id
+                        ui.notify("Book added successfully!", type="positive")
+                        ui.navigate.to(f"/content/{content.id}")
+                    else:
+                        ui.notify("Failed to add book", type="negative")
+
+                except Exception as e:
+                    logger.error("Error adding book: %s", e, exc_info=True)
+                    ui.notify(f"Error adding book: {str(e)}", type="negative")
+                finally:
+                    state.submitting = False
+
+            book_form.on("submit", submit_book)
+
+    # Seed both pickers with their first page of options, fetched concurrently
+    try:
+        bucket = ttl_bucket()
+        author_options, category_options = await asyncio.gather(
+            run.io_bound(_author_seed_options, AuthorService.get_version(), bucket),
+            run.io_bound(_category_seed_options, CategoryService.get_version(), bucket),
+        )
+        author_select.set_options(author_options)
+        category_select.set_options(category_options)
+    except Exception as e:
+        logger.error("Error loading authors and categories: %s", e, exc_info=True)
+        ui.notify(f"Error loading authors and categories: {str(e)}", type="negative")
+
+
+async def _build_article_form(container: ui.column) -> None:
+    """Create form for adding an article."""
+    with container:
+        with ui.card().classes(_CARD_CLS):
+            ui.label("Article Information").classes(_HEADING_CLS)
+            ui.label("Article form coming soon...").classes("text-gray-500")
+
+
+async def _build_magazine_form(container: ui.column) -> None:
+    """Create form for adding a magazine."""
+    with container:
+        with ui.card().classes(_CARD_CLS):
+            ui.label("Magazine Information").classes(_HEADING_CLS)
+            ui.label("Magazine form coming soon...").classes("text-gray-500")
+
+
+async def _build_multimedia_form(container: ui.column) -> None:
+    """Create form for adding multimedia content."""
+    with container:
+        with ui.card().classes(_CARD_CLS):
+            ui.label("Multimedia Information").classes(_HEADING_CLS)
+            ui.label("Multimedia form coming soon...").classes("text-gray-500")
+
+
+_FORM_BUILDERS: Dict[ContentType, Callable[[ui.column], Awaitable[None]]] = {
+    ContentType.BOOK: _build_book_form,
+    ContentType.ARTICLE: _build_article_form,
+    ContentType.MAGAZINE: _build_magazine_form,
+    ContentType.MULTIMEDIA: _build_multimedia_form,
+}
+
 
 def create():
     """Create content management pages."""
 
     @ui.page("/add-content")
-    def add_content_page():
+    async def add_content_page():
         """Page for adding new content to the library."""
 
         # Header
@@ -25,234 +368,38 @@ def create():
 
         with ui.column().classes("w-full max-w-4xl mx-auto p-6 gap-6"):
             # Content Type Selection
-            with ui.card().classes("w-full p-6"):
-                ui.label("Select Content Type").classes("text-xl font-semibold text-gray-800 mb-4")
+            with ui.card().classes(_CARD_CLS):
+                ui.label("Select Content Type").classes(_HEADING_CLS)
 
                 content_type_select = ui.select(
                     label="Content Type",
-                    options={
-                        ContentType.BOOK: "Book",
-                        ContentType.ARTICLE: "Article",
-                        ContentType.MAGAZINE: "Magazine",
-                        ContentType.MULTIMEDIA: "Multimedia",
-                    },
+                    options=_CONTENT_TYPE_OPTIONS,
                     value=ContentType.BOOK,
                 ).classes("w-full")
 
             # Dynamic form container
             form_container = ui.column().classes("w-full gap-6")
 
-            def update_form():
+            rendered_type: List[Optional[ContentType]] = [None]
+
+            async def update_form():
                 """Update form based on selected content type."""
-                form_container.clear()
+                # Quasar also emits model updates that keep the same value; don't rebuild the form for those
+                if content_type_select.value == rendered_type[0]:
+                    return
+                rendered_type[0] = content_type_select.value
 
-                selected_type = content_type_select.value
-
-                match selected_type:
-                    case ContentType.BOOK:
-                        create_book_form()
-                    case ContentType.ARTICLE:
-                        create_article_form()
-                    case ContentType.MAGAZINE:
-                        create_magazine_form()
-                    case ContentType.MULTIMEDIA:
-                        create_multimedia_form()
-
-            def create_book_form():
-                """Create form for adding a book."""
-                with form_container:
-                    with ui.card().classes("w-full p-6"):
-                        ui.label("Book Information").classes("text-xl font-semibold text-gray-800 mb-4")
-
-                        # Basic content fields
-                        title_input = ui.input("Title").classes("w-full mb-4").props("required")
-                        description_input = ui.textarea("Description").classes("w-full mb-4").props("rows=4")
-                        isbn_input = ui.input("ISBN").classes("w-full mb-4")
-                        language_input = ui.input("Language", value="English").classes("w-full mb-4")
-
-                        # Publication date
-                        pub_date_input = ui.date("Publication Date").classes("w-full mb-4")
-
-                        # Tags
-                        tags_input = ui.input("Tags (comma-separated)").classes("w-full mb-4")
-
-                        # Book-specific fields
-                        ui.label("Book Details").classes("text-lg font-semibold text-gray-800 mb-2 mt-4")
-                        publisher_input = ui.input("Publisher").classes("w-full mb-4")
-                        pages_input = ui.number("Page Count", min=1).classes("w-full mb-4")
-                        edition_input = ui.input("Edition").classes("w-full mb-4")
-                        format_select = ui.select(
-                            options=["paperback", "hardcover", "ebook", "audiobook"], value="paperback", label="Format"
-                        ).classes("w-full mb-4")
-
-                        # Author selection
-                        ui.label("Authors").classes("text-lg font-semibold text-gray-800 mb-2")
-                        author_container = ui.column().classes("w-full mb-4")
-                        selected_authors = []
-
-                        def load_authors():
-                            """Load available authors."""
-                            try:
-                                authors = AuthorService.get_all_authors()
-                                author_options = {
-                                    author.id: f"{author.first_name} {author.last_name}"
-                                    for author in authors
-                                    if author.id is not None
-                                }
-
-                                author_container.clear()
-                                with author_container:
-                                    if author_options:
-                                        author_select = ui.select(
-                                            options=author_options, multiple=True, label="Select Authors"
-                                        ).classes("w-full")
-
-                                        def update_authors(e):
-                                            selected_authors.clear()
-                                            if e.value:
-                                                selected_authors.extend(e.value)
-
-                                        author_select.on("update:model-value", update_authors)
-                                    else:
-                                        ui.label("No authors found. Add authors first.").classes("text-gray-500")
-
-                            except Exception as e:
-                                logger.error(f"Error loading authors: {str(e)}")
-                                with author_container:
-                                    ui.label(f"Error loading authors: {str(e)}").classes("text-red-500")
-
-                        load_authors()
-
-                        # Category selection
-                        ui.label("Categories").classes("text-lg font-semibold text-gray-800 mb-2")
-                        category_container = ui.column().classes("w-full mb-6")
-                        selected_categories = []
-
-                        def load_categories():
-                            """Load available categories."""
-                            try:
-                                categories = CategoryService.get_all_categories()
-                                category_options = {
-                                    category.id: category.name for category in categories if category.id is not None
-                                }
-
-                                category_container.clear()
-                                with category_container:
-                                    if category_options:
-                                        category_select = ui.select(
-                                            options=category_options, multiple=True, label="Select Categories"
-                                        ).classes("w-full")
-
-                                        def update_categories(e):
-                                            selected_categories.clear()
-                                            if e.value:
-                                                selected_categories.extend(e.value)
-
-                                        category_select.on("update:model-value", update_categories)
-                                    else:
-                                        ui.label("No categories found. Add categories first.").classes("text-gray-500")
-
-                            except Exception as e:
-                                logger.error(f"Error loading categories: {str(e)}")
-                                with category_container:
-                                    ui.label(f"Error loading categories: {str(e)}").classes("text-red-500")
-
-                        load_categories()
-
-                        # Submit button
-                        with ui.row().classes("gap-4 justify-end"):
-                            ui.button("Cancel", on_click=lambda: ui.navigate.to("/")).props("outline")
-                            ui.button("Add Book", icon="add", on_click=lambda: submit_book()).classes(
-                                "bg-primary text-white"
-                            )
-
-                        def submit_book():
-                            """Submit the book form."""
-                            try:
-                                # Validate required fields
-                                if not title_input.value:
-                                    ui.notify("Title is required", type="negative")
-                                    return
-
-                                # Parse tags
-                                tags = []
-                                if tags_input.value:
-                                    tags = [tag.strip() for tag in tags_input.value.split(",") if tag.strip()]
-
-                                # Parse publication date
-                                pub_date = None
-                                if pub_date_input.value:
-                                    if isinstance(pub_date_input.value, str):
-                                        pub_date = datetime.fromisoformat(pub_date_input.value)
-                                    elif isinstance(pub_date_input.value, date):
-                                        pub_date = datetime.combine(pub_date_input.value, datetime.min.time())
-
-                                # Create content data
-                                content_data = ContentCreate(
-                                    title=title_input.value,
-                                    description=description_input.value or "",
-                                    content_type=ContentType.BOOK,
-                                    isbn=isbn_input.value,
-                                    language=language_input.value or "English",
-                                    publication_date=pub_date,
-                                    tags=tags,
-                                )
-
-                                # Create book data
-                                book_data = BookCreate(
-                                    publisher=publisher_input.value or "",
-                                    page_count=int(pages_input.value) if pages_input.value else None,
-                                    edition=edition_input.value or "",
-                                    format=format_select.value or "paperback",
-                                )
-
-                                # Create the book
-                                content = ContentService.create_book(
-                                    content_data=content_data,
-                                    book_data=book_data,
-                                    author_ids=selected_authors if selected_authors else None,
-                                    category_ids=selected_categories if selected_categories else None,
-                                )
-
-                                if content and content.id is not None:
-                                    ui.notify("Book added successfully!", type="positive")
-                                    ui.navigate.to(f"/content/{content.id}")
-                                else:
-                                    ui.notify("Failed to add book", type="negative")
-
-                            except Exception as e:
-                                logger.error(f"Error adding book: {str(e)}")
-                                ui.notify(f"Error adding book: {str(e)}", type="negative")
-
-            def create_article_form():
-                """Create form for adding an article."""
-                with form_container:
-                    with ui.card().classes("w-full p-6"):
-                        ui.label("Article Information").classes("text-xl font-semibold text-gray-800 mb-4")
-                        ui.label("Article form coming soon...").classes("text-gray-500")
-
-            def create_magazine_form():
-                """Create form for adding a magazine."""
-                with form_container:
-                    with ui.card().classes("w-full p-6"):
-                        ui.label("Magazine Information").classes("text-xl font-semibold text-gray-800 mb-4")
-                        ui.label("Magazine form coming soon...").classes("text-gray-500")
-
-            def create_multimedia_form():
-                """Create form for adding multimedia content."""
-                with form_container:
-                    with ui.card().classes("w-full p-6"):
-                        ui.label("Multimedia Information").classes("text-xl font-semibold text-gray-800 mb-4")
-                        ui.label("Multimedia form coming soon...").classes("text-gray-500")
+                form_container.clear()
+                await _FORM_BUILDERS[content_type_select.value](form_container)
 
             # Initial form load
-            update_form()
+            await update_form()
 
             # Update form when content type changes
-            content_type_select.on("update:model-value", lambda: update_form())
+            content_type_select.on("update:model-value", update_form)
 
     @ui.page("/manage-authors")
-    def manage_authors_page():
+    async def manage_authors_page():
         """Page for managing authors."""
 
         # Header
@@ -265,8 +412,8 @@ def create():
 
         with ui.column().classes("w-full max-w-6xl mx-auto p-6 gap-6"):
             # Add new author form
-            with ui.card().classes("w-full p-6"):
-                ui.label("Add New Author").classes("text-xl font-semibold text-gray-800 mb-4")
+            with ui.card().classes(_CARD_CLS):
+                ui.label("Add New Author").classes(_HEADING_CLS)
 
                 with ui.row().classes("gap-4 items-end"):
                     first_name_input = ui.input("First Name").classes("flex-1")
@@ -277,14 +424,15 @@ def create():
 
                 biography_input = ui.textarea("Biography (optional)").classes("w-full mt-4").props("rows=3")
 
-                def add_author():
+                async def add_author():
                     """Add a new author."""
                     try:
                         if not first_name_input.value or not last_name_input.value:
                             ui.notify("First name and last name are required", type="negative")
                             return
 
-                        author = AuthorService.create_author(
+                        author = await run.io_bound(
+                            AuthorService.create_author,
                             first_name=first_name_input.value,
                             last_name=last_name_input.value,
                             biography=biography_input.value or "",
@@ -297,52 +445,86 @@ def create():
                         last_name_input.value = ""
                         biography_input.value = ""
 
-                        # Refresh author list
-                        load_authors()
+                        # Show the new author without reloading the whole list
+                        append_author(author)
 
                     except Exception as e:
-                        logger.error(f"Error adding author: {str(e)}")
+                        logger.error("Error adding author: %s", e, exc_info=True)
                         ui.notify(f"Error adding author: {str(e)}", type="negative")
 
-            # Authors list
-            authors_container = ui.column().classes("w-full gap-4")
+            # Authors list: the first page is rendered up front, later pages are fetched on scroll
+            authors_page = _ListPage()
+            with ui.column().classes("w-full gap-4"):
+                authors_count_label = ui.label().classes(_HEADING_CLS)
+                with ui.scroll_area(on_scroll=lambda e: on_authors_scroll(e)).classes(
+                    _LIST_SCROLL_CLS
+                ) as authors_scroll:
+                    # Cards live in html chunks that take part in the grid layout directly (display: contents)
+                    authors_grid = ui.element("div").classes("w-full grid grid-cols-3 gap-4")
+                no_authors_label = ui.label("No authors found").classes("text-gray-500 text-center")
+                authors_error_label = ui.label().classes("text-red-500")
+
+            def show_author_count():
+                """Sync the count label and empty state with the number of authors."""
+                authors_count_label.set_text(f"All Authors ({authors_page.total})")
+                authors_count_label.set_visibility(authors_page.total > 0)
+                authors_scroll.set_visibility(authors_page.total > 0)
+                no_authors_label.set_visibility(authors_page.total == 0)
+
+            async def load_next_authors():
+                """Append the next page of authors to the grid."""
+                # Scroll events keep arriving while a page is fetched; only one fetch may advance the offset
+                if authors_page.loading:
+                    return
+                authors_page.loading = True
+                try:
+                    authors = await run.io_bound(cached_get_authors_page, authors_page.offset, _LIST_PAGE_SIZE)
 
-            def load_authors():
-                """Load and display all authors."""
+                    if authors:
+                        authors_page.add_chunk(
+                            authors_grid, [(_author_sort_key(author), _author_card_html(author)) for author in authors]
+                        )
+                    authors_page.done = len(authors) < _LIST_PAGE_SIZE or authors_page.offset >= authors_page.total
+                    authors_error_label.set_visibility(False)
+
+                except Exception as e:
+                    logger.error("Error loading authors: %s", e, exc_info=True)
+                    authors_error_label.set_text(f"Error loading authors: {str(e)}")
+                    authors_error_label.set_visibility(True)
+                finally:
+                    authors_page.loading = False
+
+            async def load_authors():
+                """Load the author count and the first page of authors."""
                 try:
-                    authors = AuthorService.get_all_authors()
-
-                    authors_container.clear()
-
-                    with authors_container:
-                        if authors:
-                            ui.label(f"All Authors ({len(authors)})").classes(
-                                "text-xl font-semibold text-gray-800 mb-4"
-                            )
-
-                            with ui.grid(columns=3).classes("w-full gap-4"):
-                                for author in authors:
-                                    with ui.card().classes("p-4"):
-                                        ui.label(f"{author.first_name} {author.last_name}").classes(
-                                            "text-lg font-semibold text-gray-800"
-                                        )
-                                        if author.biography:
-                                            ui.label(author.biography).classes(
-                                                "text-sm text-gray-600 mt-2 line-clamp-3"
-                                            )
-                        else:
-                            ui.label("No authors found").classes("text-gray-500 text-center")
+                    authors_page.total = await run.io_bound(cached_count_authors)
+                    show_author_count()
+                    await load_next_authors()
 
                 except Exception as e:
-                    logger.error(f"Error loading authors: {str(e)}")
-                    with authors_container:
-                        ui.label(f"Error loading authors: {str(e)}").classes("text-red-500")
+                    logger.error("Error loading authors: %s", e, exc_info=True)
+                    authors_error_label.set_text(f"Error loading authors: {str(e)}")
+                    authors_error_label.set_visibility(True)
+
+            async def on_authors_scroll(e):
+                if e.vertical_percentage > 0.9 and not authors_page.done:
+                    await load_next_authors()
+
+            def append_author(author):
+                """Show a newly created author without reloading the list."""
+                authors_page.total += 1
+                show_author_count()
+                # A new author sorting before the last rendered card shifts the unloaded pages by one, so it is
+                # rendered now, in place; one sorting after it arrives with its page, unless every page is loaded
+                key = _author_sort_key(author)
+                if authors_page.done or key < authors_page.last_key:
+                    authors_page.insert_card(authors_grid, key, _author_card_html(author))
 
             # Load initial authors
-            load_authors()
+            await load_authors()
 
     @ui.page("/manage-categories")
-    def manage_categories_page():
+    async def manage_categories_page():
         """Page for managing categories."""
 
         # Header
@@ -355,8 +537,8 @@ def create():
 
         with ui.column().classes("w-full max-w-6xl mx-auto p-6 gap-6"):
             # Add new category form
-            with ui.card().classes("w-full p-6"):
-                ui.label("Add New Category").classes("text-xl font-semibold text-gray-800 mb-4")
+            with ui.card().classes(_CARD_CLS):
+                ui.label("Add New Category").classes(_HEADING_CLS)
 
                 with ui.row().classes("gap-4 items-end"):
                     name_input = ui.input("Category Name").classes("flex-1")
@@ -366,15 +548,17 @@ def create():
 
                 description_input = ui.textarea("Description (optional)").classes("w-full mt-4").props("rows=2")
 
-                def add_category():
+                async def add_category():
                     """Add a new category."""
                     try:
                         if not name_input.value:
                             ui.notify("Category name is required", type="negative")
                             return
 
-                        category = CategoryService.create_category(
-                            name=name_input.value, description=description_input.value or ""
+                        category = await run.io_bound(
+                            CategoryService.create_category,
+                            name=name_input.value,
+                            description=description_input.value or "",
                         )
 
                         ui.notify(f'Category "{category.name}" added successfully!', type="positive")
@@ -383,42 +567,83 @@ def create():
                         name_input.value = ""
                         description_input.value = ""
 
-                        # Refresh category list
-                        load_categories()
+                        # Show the new category without reloading the whole list
+                        append_category(category)
 
                     except Exception as e:
-                        logger.error(f"Error adding category: {str(e)}")
+                        logger.error("Error adding category: %s", e, exc_info=True)
                         ui.notify(f"Error adding category: {str(e)}", type="negative")
 
-            # Categories list
-            categories_container = ui.column().classes("w-full gap-4")
-
-            def load_categories():
-                """Load and display all categories."""
+            # Categories list: the first page is rendered up front, later pages are fetched on scroll
+            categories_page = _ListPage()
+            with ui.column().classes("w-full gap-4"):
+                categories_count_label = ui.label().classes(_HEADING_CLS)
+                with ui.scroll_area(on_scroll=lambda e: on_categories_scroll(e)).classes(
+                    _LIST_SCROLL_CLS
+                ) as categories_scroll:
+                    # Cards live in html chunks that take part in the grid layout directly (display: contents)
+                    categories_grid = ui.element("div").classes("w-full grid grid-cols-4 gap-4")
+                no_categories_label = ui.label("No categories found").classes("text-gray-500 text-center")
+                categories_error_label = ui.label().classes("text-red-500")
+
+            def show_category_count():
+                """Sync the count label and empty state with the number of categories."""
+                categories_count_label.set_text(f"All Categories ({categories_page.total})")
+                categories_count_label.set_visibility(categories_page.total > 0)
+                categories_scroll.set_visibility(categories_page.total > 0)
+                no_categories_label.set_visibility(categories_page.total == 0)
+
+            async def load_next_categories():
+                """Append the next page of categories to the grid."""
+                # Scroll events keep arriving while a page is fetched; only one fetch may advance the offset
+                if categories_page.loading:
+                    return
+                categories_page.loading = True
                 try:
-                    categories = CategoryService.get_all_categories()
-
-                    categories_container.clear()
+                    categories = await run.io_bound(cached_get_categories_page, categories_page.offset, _LIST_PAGE_SIZE)
 
-                    with categories_container:
-                        if categories:
-                            ui.label(f"All Categories ({len(categories)})").classes(
-                                "text-xl font-semibold text-gray-800 mb-4"
-                            )
+                    if categories:
+                        categories_page.add_chunk(
+                            categories_grid,
+                            [(_category_sort_key(category), _category_card_html(category)) for category in categories],
+                        )
+                    categories_page.done = (
+                        len(categories) < _LIST_PAGE_SIZE or categories_page.offset >= categories_page.total
+                    )
+                    categories_error_label.set_visibility(False)
 
-                            with ui.grid(columns=4).classes("w-full gap-4"):
-                                for category in categories:
-                                    with ui.card().classes("p-4"):
-                                        ui.label(category.name).classes("text-lg font-semibold text-gray-800")
-                                        if category.description:
-                                            ui.label(category.description).classes("text-sm text-gray-600 mt-2")
-                        else:
-                            ui.label("No categories found").classes("text-gray-500 text-center")
+                except Exception as e:
+                    logger.error("Error loading categories: %s", e, exc_info=True)
+                    categories_error_label.set_text(f"Error loading categories: {str(e)}")
+                    categories_error_label.set_visibility(True)
+                finally:
+                    categories_page.loading = False
+
+            async def load_categories():
+                """Load the category count and the first page of categories."""
+                try:
+                    categories_page.total = await run.io_bound(cached_count_categories)
+                    show_category_count()
+                    await load_next_categories()
 
                 except Exception as e:
-                    logger.error(f"Error loading categories: {str(e)}")
-                    with categories_container:
-                        ui.label(f"Error loading categories: {str(e)}").classes("text-red-500")
+                    logger.error("Error loading categories: %s", e, exc_info=True)
+                    categories_error_label.set_text(f"Error loading categories: {str(e)}")
+                    categories_error_label.set_visibility(True)
+
+            async def on_categories_scroll(e):
+                if e.vertical_percentage > 0.9 and not categories_page.done:
+                    await load_next_categories()
+
+            def append_category(category):
+                """Show a newly created category without reloading the list."""
+                categories_page.total += 1
+                show_category_count()
+                # A new category sorting before the last rendered card shifts the unloaded pages by one, so it is
+                # rendered now, in place; one sorting after it arrives with its page, unless every page is loaded
+                key = _category_sort_key(category)
+                if categories_page.done or key < categories_page.last_key:
+                    categories_page.insert_card(categories_grid, key, _category_card_html(category))
 
             # Load initial categories
-            load_categories()
+            await load_categories()
@@ -1,59 +1,280 @@
-from typing import List, Optional, Dict, Any
-from sqlmodel import select, or_, and_, func, col
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Sequence, Tuple, TypeVar, Union
+from sqlmodel import Session, SQLModel, select, or_, func, col
+from sqlalchemy import Boolean, ColumnElement, DateTime, Row, Select, String, exists, insert, literal_column, tuple_
+from sqlalchemy import select as core_select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.orm import joinedload
+from datetime import datetime
+import base64
+import json
 import logging
 
-from app.database import get_session
+from app.database import get_session, session_scope
 from app.models import (
     Content,
     Book,
-    Article,
-    Magazine,
-    Multimedia,
     Author,
     Category,
     ContentType,
     ContentStatus,
     ContentCreate,
     BookCreate,
+    BookImport,
+    AuthorCreate,
+    CategoryCreate,
     ContentAuthor,
     ContentCategory,
 )
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=SQLModel)
+SelectT = TypeVar("SelectT", bound=Select)
+
+
+def _insert_all_returning(session: Session, entities: List[ModelT]) -> List[ModelT]:
+    """Insert entities of one model in a single INSERT ... RETURNING and detach the rows, in the order given."""
+    model = type(entities[0])
+    rows = list(
+        session.scalars(
+            insert(model).returning(model, sort_by_parameter_order=True),
+            [entity.model_dump(exclude={"id"}) for entity in entities],
+        )
+    )
+    for row in rows:
+        session.expunge(row)
+    return rows
+
+
+def _insert_authors(session: Session, authors: List[AuthorCreate]) -> List[Author]:
+    """Insert authors in the session's transaction without committing, returned in the order given."""
+    return _insert_all_returning(session, [Author(**author.model_dump()) for author in authors])
+
+
+def _insert_categories(session: Session, categories: List[CategoryCreate]) -> List[Category]:
+    """Insert categories in the session's transaction without committing, returned in the order given."""
+    return _insert_all_returning(session, [Category(**category.model_dump()) for category in categories])
+
+
+def _insert_books(session: Session, imports: List[BookImport]) -> List[Content]:
+    """Insert books with their details and links in the session's transaction without committing."""
+    # Create content; RETURNING hands back the IDs, in import order
+    contents = []
+    for item in imports:
+        content = Content(**item.content.model_dump())
+        content.content_type = ContentType.BOOK
+        contents.append(content)
+    contents = _insert_all_returning(session, contents)
+
+    # Create book-specific information; these and the link rows go in as Core executemany inserts
+    session.execute(
+        insert(Book),
+        [{**item.book.model_dump(), "content_id": content.id} for item, content in zip(imports, contents, strict=True)],
+    )
+    author_links = [
+        {"content_id": content.id, "author_id": author_id}
+        for item, content in zip(imports, contents, strict=True)
+        for author_id in item.author_ids
+    ]
+    if author_links:
+        session.execute(insert(ContentAuthor), author_links)
+    category_links = [
+        {"content_id": content.id, "category_id": category_id}
+        for item, content in zip(imports, contents, strict=True)
+        for category_id in item.category_ids
+    ]
+    if category_links:
+        session.execute(insert(ContentCategory), category_links)
+    return contents
+
+
+# Content relationship holding the type-specific information of each content type
+_EXTENSIONS: Dict[ContentType, str] = {
+    ContentType.BOOK: "book",
+    ContentType.ARTICLE: "article",
+    ContentType.MAGAZINE: "magazine",
+    ContentType.MULTIMEDIA: "multimedia",
+}
+
+
+class _utc_days_ago(FunctionElement):
+    """Naive UTC timestamp the given number of days before the database clock, matching created_at."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_utc_days_ago)
+def _compile_utc_days_ago(element, compiler, **kw):
+    return "timezone('utc', now()) - make_interval(days => %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(_utc_days_ago, "sqlite")
+def _compile_utc_days_ago_sqlite(element, compiler, **kw):
+    return "datetime('now', '-' || %s || ' days')" % compiler.process(element.clauses, **kw)
+
+
+class _full_text_match(FunctionElement):
+    """True where the document holds the words of the query, stemmed; full text search is Postgres only."""
+
+    type = Boolean()
+    inherit_cache = True
+
+
+@compiles(_full_text_match)
+def _compile_full_text_match(element, compiler, **kw):
+    # Without full text search the substring match it is combined with stands alone
+    return "1 = 0"
+
+
+@compiles(_full_text_match, "postgresql")
+def _compile_full_text_match_postgresql(element, compiler, **kw):
+    document, query = element.clauses
+    return "to_tsvector('english', %s) @@ websearch_to_tsquery('english', %s)" % (
+        compiler.process(document, **kw),
+        compiler.process(query, **kw),
+    )
+
+
+# The searched text, spelled like the expression of the content_search_fts index so Postgres can use it
+_SEARCH_DOCUMENT = col(Content.title).concat(literal_column("' '")).concat(col(Content.description))
+
+
+class _iso_date(FunctionElement):
+    """A timestamp formatted as YYYY-MM-DD by the database, or NULL."""
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(_iso_date)
+def _compile_iso_date(element, compiler, **kw):
+    return "to_char(%s, 'YYYY-MM-DD')" % compiler.process(element.clauses, **kw)
+
+
+@compiles(_iso_date, "sqlite")
+def _compile_iso_date_sqlite(element, compiler, **kw):
+    return "strftime('%%Y-%%m-%%d', %s)" % compiler.process(element.clauses, **kw)
+
+
+class _tags_preview(FunctionElement):
+    """The first three tags of a JSON tag list joined by commas, plus "+N more" for the rest; NULL without tags."""
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(_tags_preview)
+def _compile_tags_preview(element, compiler, **kw):
+    tags = compiler.process(element.clauses, **kw)
+    return (
+        "(SELECT string_agg(tag, ', ' ORDER BY position) FROM json_array_elements_text(%(tags)s)"
+        " WITH ORDINALITY AS tag_list(tag, position) WHERE position <= 3)"
+        " || CASE WHEN json_array_length(%(tags)s) > 3"
+        " THEN ' +' || (json_array_length(%(tags)s) - 3) || ' more' ELSE '' END"
+    ) % {"tags": tags}
+
+
+@compiles(_tags_preview, "sqlite")
+def _compile_tags_preview_sqlite(element, compiler, **kw):
+    tags = compiler.process(element.clauses, **kw)
+    return (
+        "(SELECT group_concat(value, ', ') FROM (SELECT value FROM json_each(%(tags)s) ORDER BY key LIMIT 3))"
+        " || CASE WHEN json_array_length(%(tags)s) > 3"
+        " THEN ' +' || (json_array_length(%(tags)s) - 3) || ' more' ELSE '' END"
+    ) % {"tags": tags}
+
+
+# Columns shown by content cards; summary lists skip the rest (ISBN, metadata JSON, update time)
+_SUMMARY_COLUMNS = (
+    col(Content.id),
+    col(Content.title),
+    col(Content.description),
+    col(Content.content_type),
+    col(Content.status),
+    col(Content.language),
+    _iso_date(col(Content.publication_date)).label("published"),
+    _tags_preview(col(Content.tags)).label("tags_preview"),
+    col(Content.created_at),
+)
+
+# Read-only row of the summary columns; its attributes read like those of Content, except that the
+# publication date and tags come as published and tags_preview, already formatted for display
+ContentSummary = Row[Any]
+
 
 class ContentService:
     """Service layer for content management operations."""
 
+    # Bumped on every write so cached content counts can be invalidated
+    version: int = 0
+
+    @staticmethod
+    def get_version() -> int:
+        """Get the content write version of this process."""
+        return ContentService.version
+
     @staticmethod
     def search_content(
-        query: str = "", content_type: Optional[ContentType] = None, available_only: bool = True, limit: int = 50
+        query: str = "",
+        content_type: Optional[ContentType] = None,
+        available_only: bool = True,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, int]] = None,
     ) -> List[Content]:
-        """Search content by title, description, or tags."""
+        """Search content by title, description, or tags, newest first, continuing after cursor if given."""
         with get_session() as session:
-            stmt = select(Content)
+            stmt = select(Content).where(*ContentService._search_filters(query, content_type, available_only))
 
-            # Apply search filter
-            if query:
-                search_filter = or_(
-                    col(Content.title).ilike(f"%{query}%"), col(Content.description).ilike(f"%{query}%")
-                )
-                stmt = stmt.where(search_filter)
+            # Order by created_at descending, seeking past the cursor instead of skipping rows with OFFSET
+            stmt = ContentService._seek_newest_first(stmt, cursor)
 
-            # Apply content type filter
-            if content_type is not None:
-                stmt = stmt.where(Content.content_type == content_type)
+            stmt = stmt.limit(limit)
+            return list(session.exec(stmt))
 
-            # Filter by availability
-            if available_only:
-                stmt = stmt.where(Content.status == ContentStatus.AVAILABLE)
+    @staticmethod
+    def search_content_summaries(
+        query: str = "",
+        content_type: Optional[ContentType] = None,
+        available_only: bool = True,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, int]] = None,
+    ) -> List[ContentSummary]:
+        """Search content like search_content, as plain summary rows for read-only listings."""
+        with get_session() as session:
+            stmt = core_select(*_SUMMARY_COLUMNS).where(
+                *ContentService._search_filters(query, content_type, available_only)
+            )
+            stmt = ContentService._seek_newest_first(stmt, cursor).limit(limit)
+            return list(session.execute(stmt))
 
-            # Order by created_at descending
-            stmt = stmt.order_by(col(Content.created_at).desc())
+    @staticmethod
+    def _search_filters(
+        query: str, content_type: Optional[ContentType], available_only: bool
+    ) -> List[ColumnElement[bool]]:
+        """Build the WHERE clauses of a content search."""
+        filters: List[ColumnElement[bool]] = []
+
+        # Apply search filter; word matches also find other forms of a word ("robot" finds "Robots")
+        if query:
+            filters.append(
+                or_(
+                    _full_text_match(_SEARCH_DOCUMENT, query),
+                    col(Content.title).ilike(f"%{query}%"),
+                    col(Content.description).ilike(f"%{query}%"),
+                )
+            )
 
-            stmt = stmt.limit(limit)
-            return list(session.exec(stmt))
+        # Apply content type filter
+        if content_type is not None:
+            filters.append(col(Content.content_type) == content_type)
+
+        # Filter by availability
+        if available_only:
+            filters.append(col(Content.status) == ContentStatus.AVAILABLE)
+
+        return filters
 
     @staticmethod
     def get_content_by_id(content_id: int) -> Optional[Content]:
@@ -67,44 +288,55 @@ class ContentService:
         with get_session() as session:
             stmt = (
                 select(Content)
+                .options(joinedload(Content.book))
                 .where(Content.content_type == ContentType.BOOK)
                 .order_by(col(Content.created_at).desc())
                 .limit(limit)
             )
             return list(session.exec(stmt))
 
+    @staticmethod
+    def has_books() -> bool:
+        """Check whether any book exists, without loading one."""
+        with get_session() as session:
+            stmt = core_select(exists().where(col(Content.content_type) == ContentType.BOOK))
+            return bool(session.scalar(stmt))
+
+    @staticmethod
+    def get_book_summaries(limit: int = 20, cursor: Optional[Tuple[datetime, int]] = None) -> List[ContentSummary]:
+        """Get the newest books as plain summary rows for read-only listings, continuing after cursor if given."""
+        with get_session() as session:
+            stmt = core_select(*_SUMMARY_COLUMNS).where(col(Content.content_type) == ContentType.BOOK)
+            stmt = ContentService._seek_newest_first(stmt, cursor).limit(limit)
+            return list(session.execute(stmt))
+
     @staticmethod
     def get_content_with_details(content_id: int) -> Optional[Dict[str, Any]]:
         """Get content with all related details (book/article/magazine/multimedia)."""
         with get_session() as session:
-            content = session.get(Content, content_id)
+            # Everything is joined into one round trip; one item has few authors and categories, so the
+            # authors x categories row product stays small, and unique() folds it back into one Content
+            stmt = (
+                select(Content)
+                .where(Content.id == content_id)
+                .options(
+                    joinedload(Content.authors),
+                    joinedload(Content.categories),
+                    *[joinedload(getattr(Content, extension)) for extension in _EXTENSIONS.values()],
+                )
+            )
+            content = session.exec(stmt).unique().first()
             if content is None:
                 return None
 
-            result = {
+            extension = _EXTENSIONS.get(content.content_type)
+            return {
                 "content": content,
-                "authors": ContentService.get_content_authors(content_id),
-                "categories": ContentService.get_content_categories(content_id),
-                "extended_info": None,
+                "authors": list(content.authors),
+                "categories": list(content.categories),
+                "extended_info": getattr(content, extension) if extension is not None else None,
             }
 
-            # Get type-specific information
-            match content.content_type:
-                case ContentType.BOOK:
-                    stmt = select(Book).where(Book.content_id == content_id)
-                    result["extended_info"] = session.exec(stmt).first()
-                case ContentType.ARTICLE:
-                    stmt = select(Article).where(Article.content_id == content_id)
-                    result["extended_info"] = session.exec(stmt).first()
-                case ContentType.MAGAZINE:
-                    stmt = select(Magazine).where(Magazine.content_id == content_id)
-                    result["extended_info"] = session.exec(stmt).first()
-                case ContentType.MULTIMEDIA:
-                    stmt = select(Multimedia).where(Multimedia.content_id == content_id)
-                    result["extended_info"] = session.exec(stmt).first()
-
-            return result
-
     @staticmethod
     def get_content_authors(content_id: int) -> List[Author]:
         """Get all authors for a content item."""
@@ -119,6 +351,57 @@ class ContentService:
             stmt = select(Category).join(ContentCategory).where(ContentCategory.content_id == content_id)
             return list(session.exec(stmt))
 
+    @staticmethod
+    def batch_get_authors(content_ids: List[int]) -> Dict[int, List[Author]]:
+        """Get the authors of several content items in one query, keyed by content ID."""
+        result: Dict[int, List[Author]] = {content_id: [] for content_id in content_ids}
+        if not content_ids:
+            return result
+        with get_session() as session:
+            stmt = (
+                select(ContentAuthor.content_id, Author)
+                .join(Author)
+                .where(col(ContentAuthor.content_id).in_(content_ids))
+                .order_by(Author.last_name, Author.first_name)
+            )
+            for content_id, author in session.exec(stmt):
+                result[content_id].append(author)
+        return result
+
+    @staticmethod
+    def batch_get_categories(content_ids: List[int]) -> Dict[int, List[Category]]:
+        """Get the categories of several content items in one query, keyed by content ID."""
+        result: Dict[int, List[Category]] = {content_id: [] for content_id in content_ids}
+        if not content_ids:
+            return result
+        with get_session() as session:
+            stmt = (
+                select(ContentCategory.content_id, Category)
+                .join(Category)
+                .where(col(ContentCategory.content_id).in_(content_ids))
+                .order_by(Category.name)
+            )
+            for content_id, category in session.exec(stmt):
+                result[content_id].append(category)
+        return result
+
+    @staticmethod
+    def get_books_with_details(limit: int = 20) -> List[Dict[str, Any]]:
+        """Get books together with their authors and categories, using one query per relation."""
+        with session_scope():
+            books = ContentService.get_books(limit=limit)
+            content_ids = [book.id for book in books if book.id is not None]
+            authors = ContentService.batch_get_authors(content_ids)
+            categories = ContentService.batch_get_categories(content_ids)
+        return [
+            {
+                "content": book,
+                "authors": authors.get(book.id, []) if book.id is not None else [],
+                "categories": categories.get(book.id, []) if book.id is not None else [],
+            }
+            for book in books
+        ]
+
     @staticmethod
     def create_book(
         content_data: ContentCreate,
@@ -127,37 +410,29 @@ class ContentService:
         category_ids: Optional[List[int]] = None,
     ) -> Optional[Content]:
         """Create a new book with all related information."""
+        books = ContentService.create_books(
+            [
+                BookImport(
+                    content=content_data,
+                    book=book_data,
+                    author_ids=author_ids or [],
+                    category_ids=category_ids or [],
+                )
+            ]
+        )
+        return books[0] if books else None
+
+    @staticmethod
+    def create_books(imports: List[BookImport]) -> List[Content]:
+        """Create several books with their related information in one transaction."""
+        if not imports:
+            return []
         with get_session() as session:
             try:
-                # Create content
-                content = Content(**content_data.model_dump())
-                content.content_type = ContentType.BOOK
-                session.add(content)
+                contents = _insert_books(session, imports)
                 session.commit()
-                session.refresh(content)
-
-                if content.id is None:
-                    return None
-
-                # Create book-specific information
-                book = Book(**book_data.model_dump(), content_id=content.id)
-                session.add(book)
-
-                # Add author relationships
-                if author_ids:
-                    for author_id in author_ids:
-                        content_author = ContentAuthor(content_id=content.id, author_id=author_id)
-                        session.add(content_author)
-
-                # Add category relationships
-                if category_ids:
-                    for category_id in category_ids:
-                        content_category = ContentCategory(content_id=content.id, category_id=category_id)
-                        session.add(content_category)
-
-                session.commit()
-                session.refresh(content)
-                return content
+                ContentService.version += 1
+                return contents
 
             except Exception as e:
                 session.rollback()
@@ -172,41 +447,68 @@ class ContentService:
                 return False
 
             content.status = status
-            content.updated_at = datetime.utcnow()
             session.add(content)
             session.commit()
+            ContentService.version += 1
             return True
 
     @staticmethod
     def get_available_content_count() -> Dict[ContentType, int]:
         """Get count of available content by type."""
         with get_session() as session:
-            counts = {}
-            for content_type in ContentType:
-                stmt = select(func.count(col(Content.id))).where(
-                    and_(Content.content_type == content_type, Content.status == ContentStatus.AVAILABLE)
-                )
-                count = session.exec(stmt).first()
-                counts[content_type] = count or 0
+            counts = {content_type: 0 for content_type in ContentType}
+            stmt = (
+                select(Content.content_type, func.count(col(Content.id)))
+                .where(Content.status == ContentStatus.AVAILABLE)
+                .group_by(col(Content.content_type))
+            )
+            for content_type, count in session.exec(stmt):
+                counts[content_type] = count
             return counts
 
     @staticmethod
-    def get_recent_content(days: int = 30, limit: int = 10) -> List[Content]:
-        """Get recently added content."""
+    def get_recent_content(
+        days: int = 30, limit: int = 10, cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Content]:
+        """Get recently added content, continuing after cursor if given."""
         with get_session() as session:
-            cutoff_date = datetime.utcnow().replace(microsecond=0) - timedelta(days=days)
-            stmt = (
-                select(Content)
-                .where(Content.created_at >= cutoff_date)
-                .order_by(col(Content.created_at).desc())
-                .limit(limit)
-            )
+            stmt = select(Content).where(col(Content.created_at) >= _utc_days_ago(days))
+            stmt = ContentService._seek_newest_first(stmt, cursor).limit(limit)
             return list(session.exec(stmt))
 
+    @staticmethod
+    def _seek_newest_first(stmt: SelectT, cursor: Optional[Tuple[datetime, int]]) -> SelectT:
+        """Order content newest first and keep only rows after the (created_at, id) cursor."""
+        if cursor is not None:
+            stmt = stmt.where(tuple_(col(Content.created_at), col(Content.id)) < tuple_(*cursor))
+        return stmt.order_by(col(Content.created_at).desc(), col(Content.id).desc())
+
+    @staticmethod
+    def next_cursor(page: Sequence[Union[Content, ContentSummary]], limit: int) -> Optional[str]:
+        """Get the opaque cursor of the page after a full page, or None on the last page."""
+        if len(page) < limit or page[-1].id is None:
+            return None
+        last = page[-1]
+        return base64.urlsafe_b64encode(json.dumps([last.created_at.isoformat(), last.id]).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Decode a cursor produced by next_cursor."""
+        created_at, content_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(content_id)
+
 
 class AuthorService:
     """Service layer for author management."""
 
+    # Bumped on every write so cached author listings can be invalidated
+    version: int = 0
+
+    @staticmethod
+    def get_version() -> int:
+        """Get the author write version of this process."""
+        return AuthorService.version
+
     @staticmethod
     def get_all_authors() -> List[Author]:
         """Get all authors."""
@@ -215,13 +517,27 @@ class AuthorService:
             return list(session.exec(stmt))
 
     @staticmethod
-    def search_authors(query: str) -> List[Author]:
+    def get_authors_page(offset: int = 0, limit: int = 60) -> List[Author]:
+        """Get one page of authors in name order."""
+        with get_session() as session:
+            stmt = select(Author).order_by(Author.last_name, Author.first_name, Author.id).offset(offset).limit(limit)
+            return list(session.exec(stmt))
+
+    @staticmethod
+    def count_authors() -> int:
+        """Count all authors."""
+        with get_session() as session:
+            return session.exec(select(func.count(col(Author.id)))).first() or 0
+
+    @staticmethod
+    def search_authors(query: str, limit: int = 50) -> List[Author]:
         """Search authors by name."""
         with get_session() as session:
             stmt = (
                 select(Author)
                 .where(or_(col(Author.first_name).ilike(f"%{query}%"), col(Author.last_name).ilike(f"%{query}%")))
                 .order_by(Author.last_name, Author.first_name)
+                .limit(limit)
             )
             return list(session.exec(stmt))
 
@@ -234,19 +550,41 @@ class AuthorService:
         website: Optional[str] = None,
     ) -> Author:
         """Create a new author."""
+        return AuthorService.create_authors(
+            [
+                AuthorCreate(
+                    first_name=first_name,
+                    last_name=last_name,
+                    biography=biography,
+                    birth_date=birth_date,
+                    website=website,
+                )
+            ]
+        )[0]
+
+    @staticmethod
+    def create_authors(authors: List[AuthorCreate]) -> List[Author]:
+        """Create several authors with one INSERT, returned in the order given."""
+        if not authors:
+            return []
         with get_session() as session:
-            author = Author(
-                first_name=first_name, last_name=last_name, biography=biography, birth_date=birth_date, website=website
-            )
-            session.add(author)
+            created = _insert_authors(session, authors)
             session.commit()
-            session.refresh(author)
-            return author
+            AuthorService.version += 1
+            return created
 
 
 class CategoryService:
     """Service layer for category management."""
 
+    # Bumped on every write so cached category listings can be invalidated
+    version: int = 0
+
+    @staticmethod
+    def get_version() -> int:
+        """Get the category write version of this process."""
+        return CategoryService.version
+
     @staticmethod
     def get_all_categories() -> List[Category]:
         """Get all categories."""
@@ -254,6 +592,26 @@ class CategoryService:
             stmt = select(Category).order_by(Category.name)
             return list(session.exec(stmt))
 
+    @staticmethod
+    def get_categories_page(offset: int = 0, limit: int = 60) -> List[Category]:
+        """Get one page of categories in name order."""
+        with get_session() as session:
+            stmt = select(Category).order_by(Category.name, Category.id).offset(offset).limit(limit)
+            return list(session.exec(stmt))
+
+    @staticmethod
+    def count_categories() -> int:
+        """Count all categories."""
+        with get_session() as session:
+            return session.exec(select(func.count(col(Category.id)))).first() or 0
+
+    @staticmethod
+    def search_categories(query: str, limit: int = 50) -> List[Category]:
+        """Search categories by name."""
+        with get_session() as session:
+            stmt = select(Category).where(col(Category.name).ilike(f"%{query}%")).order_by(Category.name).limit(limit)
+            return list(session.exec(stmt))
+
     @staticmethod
     def get_root_categories() -> List[Category]:
         """Get top-level categories (no parent)."""
@@ -264,9 +622,17 @@ class CategoryService:
     @staticmethod
     def create_category(name: str, description: str = "", parent_id: Optional[int] = None) -> Category:
         """Create a new category."""
+        return CategoryService.create_categories(
+            [CategoryCreate(name=name, description=description, parent_id=parent_id)]
+        )[0]
+
+    @staticmethod
+    def create_categories(categories: List[CategoryCreate]) -> List[Category]:
+        """Create several categories with one INSERT, returned in the order given."""
+        if not categories:
+            return []
         with get_session() as session:
-            category = Category(name=name, description=description, parent_id=parent_id)
-            session.add(category)
+            created = _insert_categories(session, categories)
             session.commit()
-            session.refresh(category)
-            return category
+            CategoryService.version += 1
+            return created
@@ -0,0 +1,152 @@
+import time
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlmodel import SQLModel
+
+from app.content_service import AuthorService, CategoryService, ContentService
+from app.models import Author, Category, ContentType
+
+# Entries are keyed on the service write version, so a create in this process invalidates them at once,
+# and on a monotonic time bucket, so writes made by other workers show up within CACHE_TTL_SECONDS
+CACHE_TTL_SECONDS = 30
+
+
+def ttl_bucket() -> int:
+    """Current time bucket for cache keys; it changes every CACHE_TTL_SECONDS."""
+    return int(time.monotonic() // CACHE_TTL_SECONDS)
+
+
+# A model and its field values; caches hold these rather than ORM instances, which callers could change
+_Snapshot = Tuple[Type[SQLModel], Dict[str, Any]]
+
+
+def _snapshot(entity: SQLModel) -> _Snapshot:
+    return type(entity), entity.model_dump()
+
+
+def _restore(snapshot: _Snapshot) -> Any:
+    """Build a fresh, unattached instance from a snapshot, so no two callers share one object."""
+    model, values = snapshot
+    return model(**deepcopy(values))
+
+
+@lru_cache(maxsize=64)
+def _authors_page(version: int, bucket: int, offset: int, limit: int) -> Tuple[_Snapshot, ...]:
+    return tuple(_snapshot(author) for author in AuthorService.get_authors_page(offset, limit))
+
+
+@lru_cache(maxsize=1)
+def _authors_count(version: int, bucket: int) -> int:
+    return AuthorService.count_authors()
+
+
+@lru_cache(maxsize=64)
+def _categories_page(version: int, bucket: int, offset: int, limit: int) -> Tuple[_Snapshot, ...]:
+    return tuple(_snapshot(category) for category in CategoryService.get_categories_page(offset, limit))
+
+
+@lru_cache(maxsize=1)
+def _categories_count(version: int, bucket: int) -> int:
+    return CategoryService.count_categories()
+
+
+@lru_cache(maxsize=1)
+def _all_categories(version: int, bucket: int) -> Tuple[_Snapshot, ...]:
+    return tuple(_snapshot(category) for category in CategoryService.get_all_categories())
+
+
+@lru_cache(maxsize=1)
+def _root_categories(version: int, bucket: int) -> Tuple[_Snapshot, ...]:
+    return tuple(_snapshot(category) for category in CategoryService.get_root_categories())
+
+
+@lru_cache(maxsize=1024)
+def _content_details(version: int, bucket: int, content_id: int) -> Optional[Dict[str, Any]]:
+    details = ContentService.get_content_with_details(content_id)
+    if details is None:
+        return None
+    extended_info = details["extended_info"]
+    return {
+        "content": _snapshot(details["content"]),
+        "authors": tuple(_snapshot(author) for author in details["authors"]),
+        "categories": tuple(_snapshot(category) for category in details["categories"]),
+        "extended_info": _snapshot(extended_info) if extended_info is not None else None,
+    }
+
+
+@lru_cache(maxsize=1)
+def _available_content_count(version: int, bucket: int) -> Tuple[Tuple[ContentType, int], ...]:
+    return tuple(ContentService.get_available_content_count().items())
+
+
+def cached_get_authors_page(offset: int, limit: int) -> List[Author]:
+    """Get one page of authors, served from cache while no author has been created."""
+    return [_restore(author) for author in _authors_page(AuthorService.get_version(), ttl_bucket(), offset, limit)]
+
+
+def cached_count_authors() -> int:
+    """Count all authors, served from cache while no author has been created."""
+    return _authors_count(AuthorService.get_version(), ttl_bucket())
+
+
+def cached_get_categories_page(offset: int, limit: int) -> List[Category]:
+    """Get one page of categories, served from cache while no category has been created."""
+    page = _categories_page(CategoryService.get_version(), ttl_bucket(), offset, limit)
+    return [_restore(category) for category in page]
+
+
+def cached_count_categories() -> int:
+    """Count all categories, served from cache while no category has been created."""
+    return _categories_count(CategoryService.get_version(), ttl_bucket())
+
+
+def cached_get_all_categories() -> Tuple[Category, ...]:
+    """Get all categories, served from cache while no category has been created."""
+    return tuple(_restore(category) for category in _all_categories(CategoryService.get_version(), ttl_bucket()))
+
+
+def cached_get_root_categories() -> Tuple[Category, ...]:
+    """Get root categories, served from cache while no category has been created."""
+    return tuple(_restore(category) for category in _root_categories(CategoryService.get_version(), ttl_bucket()))
+
+
+def cached_get_available_content_count() -> Dict[ContentType, int]:
+    """Get count of available content by type, served from cache while no content has been written."""
+    return dict(_available_content_count(ContentService.get_version(), ttl_bucket()))
+
+
+def cached_get_content_with_details(content_id: int) -> Optional[Dict[str, Any]]:
+    """Get content with all related details, served from cache while no content has been written."""
+    details = _content_details(ContentService.get_version(), ttl_bucket(), content_id)
+    if details is None:
+        return None
+    extended_info = details["extended_info"]
+    return {
+        "content": _restore(details["content"]),
+        "authors": [_restore(author) for author in details["authors"]],
+        "categories": [_restore(category) for category in details["categories"]],
+        "extended_info": _restore(extended_info) if extended_info is not None else None,
+    }
+
+
+_CACHES = {
+    "authors_page": _authors_page,
+    "authors_count": _authors_count,
+    "categories_page": _categories_page,
+    "categories_count": _categories_count,
+    "all_categories": _all_categories,
+    "root_categories": _root_categories,
+    "available_content_count": _available_content_count,
+    "content_details": _content_details,
+}
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit, miss and size counters of every cache in this process."""
+    stats = {}
+    for name, cache in _CACHES.items():
+        info = cache.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return stats
@@ -1,12 +1,321 @@
-from nicegui import ui
-from typing import List
+from nicegui import events, run, ui
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from html import escape
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+import asyncio
 import logging
 
-from app.content_service import ContentService
-from app.models import Content, ContentType, ContentStatus
+from app.content_service import ContentService, ContentSummary
+from app.content_service_cache import cached_get_available_content_count, cached_get_content_with_details
+from app.models import Article, Book, ContentType, ContentStatus, Magazine, Multimedia
 
 logger = logging.getLogger(__name__)
 
+# Badge colors of content types on cards and of statuses on the detail page; shared, so read-only
+_TYPE_COLORS: Mapping[ContentType, str] = MappingProxyType(
+    {
+        ContentType.BOOK: "bg-blue-100 text-blue-800",
+        ContentType.ARTICLE: "bg-green-100 text-green-800",
+        ContentType.MAGAZINE: "bg-purple-100 text-purple-800",
+        ContentType.MULTIMEDIA: "bg-orange-100 text-orange-800",
+    }
+)
+_STATUS_COLORS: Mapping[ContentStatus, str] = MappingProxyType(
+    {
+        ContentStatus.AVAILABLE: "bg-green-100 text-green-800",
+        ContentStatus.CHECKED_OUT: "bg-red-100 text-red-800",
+        ContentStatus.RESERVED: "bg-yellow-100 text-yellow-800",
+        ContentStatus.MAINTENANCE: "bg-gray-100 text-gray-800",
+    }
+)
+# Full class strings and labels, put together once instead of for every card
+_TYPE_BADGE_CLASSES: Mapping[ContentType, str] = MappingProxyType(
+    {
+        content_type: f"px-2 py-1 rounded-full text-xs font-medium {_TYPE_COLORS[content_type]}"
+        for content_type in ContentType
+    }
+)
+_STATUS_BADGE_CLASSES: Mapping[ContentStatus, str] = MappingProxyType(
+    {status: f"px-3 py-1 rounded-full text-sm font-medium {_STATUS_COLORS[status]}" for status in ContentStatus}
+)
+_STATUS_TEXT_CLASSES: Mapping[ContentStatus, str] = MappingProxyType(
+    {
+        status: "text-xs text-green-500" if status == ContentStatus.AVAILABLE else "text-xs text-red-500"
+        for status in ContentStatus
+    }
+)
+_TYPE_LABELS: Mapping[ContentType, str] = MappingProxyType(
+    {content_type: content_type.value.title() for content_type in ContentType}
+)
+_STATUS_LABELS: Mapping[ContentStatus, str] = MappingProxyType(
+    {status: status.value.replace("_", " ").title() for status in ContentStatus}
+)
+# Results per page; pages are seeked by (created_at, id) cursor rather than skipped over with OFFSET
+_PAGE_SIZE = 24
+# Cards built right away so the first screen paints as before; the rest are built when scrolled into view
+_EAGER_CARDS = 12
+# Cards built between yields to the event loop
+_CARDS_PER_YIELD = 4
+# Placeholder slot reserving about one card of space without laying out its (empty) contents
+_SLOT_STYLE = "contain: strict; height: 320px"
+# Reports each placeholder slot of the grid the first time it comes within 200px of the viewport
+_OBSERVE_SLOTS_JS = """
+setTimeout(() => {
+  const grid = getHtmlElement(%(grid_id)d);
+  if (!grid) return;
+  const observer = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+      if (!entry.isIntersecting) continue;
+      observer.unobserve(entry.target);
+      getElement(%(grid_id)d).$emit("slot_visible", Number(entry.target.dataset.slot));
+    }
+  }, {rootMargin: "200px"});
+  grid.querySelectorAll("[data-slot][data-pending]").forEach((slot) => observer.observe(slot));
+}, 0);
+"""
+
+
+@dataclass
+class _ResultPages:
+    """Paging state of one result list: how pages are fetched and the cursor each visited page started at."""
+
+    fetch: Callable[..., List[ContentSummary]]
+    query: str = ""
+    cursors: List[Optional[str]] = field(default_factory=lambda: [None])
+    next_cursor: Optional[str] = None
+    loads: int = 0
+
+    @property
+    def number(self) -> int:
+        return len(self.cursors)
+
+    def start(self, fetch: Callable[..., List[ContentSummary]], query: str = "") -> None:
+        """Switch to a new result list, back on its first page."""
+        self.fetch = fetch
+        self.query = query
+        self.cursors = [None]
+        self.next_cursor = None
+
+    def turn(self, step: int) -> None:
+        """Move one page forward (step 1) or back (step -1)."""
+        if step > 0 and self.next_cursor is not None:
+            self.cursors.append(self.next_cursor)
+            # Known again once this page has loaded, so a repeated click can't skip a page
+            self.next_cursor = None
+        elif step < 0 and len(self.cursors) > 1:
+            self.cursors.pop()
+
+    def describe(self, count: int) -> str:
+        """Label a loaded page of count results: the total when it is the only page, its item range otherwise."""
+        if self.number == 1 and self.next_cursor is None:
+            return f"{count} items"
+        first = (self.number - 1) * _PAGE_SIZE + 1
+        return f"items {first}-{first + count - 1}" if count else "no more items"
+
+    def current_cursor(self) -> Optional[Tuple[datetime, int]]:
+        token = self.cursors[-1]
+        return ContentService.decode_cursor(token) if token is not None else None
+
+    async def load(self) -> Optional[List[ContentSummary]]:
+        """Fetch the current page and remember where the next one starts; None if a newer load started meanwhile."""
+        self.loads += 1
+        load = self.loads
+        results = await run.io_bound(self.fetch, limit=_PAGE_SIZE, cursor=self.current_cursor())
+        # A slow response to an earlier search or page turn must not replace newer results
+        if load != self.loads:
+            return None
+        self.next_cursor = ContentService.next_cursor(results, _PAGE_SIZE)
+        return results
+
+
+def _render_pager(pages: _ResultPages, on_turn: Callable[[int], Awaitable[None]]) -> None:
+    """Previous/next controls below a result list; nothing when everything fits on one page."""
+    if pages.number == 1 and pages.next_cursor is None:
+        return
+    with ui.row().classes("w-full justify-center items-center gap-4 mt-4"):
+        ui.button(icon="chevron_left", on_click=lambda: on_turn(-1)).props("flat").set_enabled(pages.number > 1)
+        ui.label(f"Page {pages.number}").classes("text-sm text-gray-600")
+        ui.button(icon="chevron_right", on_click=lambda: on_turn(1)).props("flat").set_enabled(
+            pages.next_cursor is not None
+        )
+
+
+def _card_html(content: ContentSummary) -> str:
+    """Render the static part of a content card as escaped HTML."""
+    parts = [
+        '<div class="row justify-between items-start mb-3">',
+        f'<div class="{_TYPE_BADGE_CLASSES[content.content_type]}">{_TYPE_LABELS[content.content_type]}</div>',
+        f'<div class="{_STATUS_TEXT_CLASSES[content.status]}">{_STATUS_LABELS[content.status]}</div>',
+        "</div>",
+        f'<div class="text-lg font-semibold text-gray-800 mb-2 line-clamp-2">{escape(content.title)}</div>',
+    ]
+    if content.description:
+        parts.append(f'<div class="text-sm text-gray-600 mb-3 line-clamp-3">{escape(content.description)}</div>')
+
+    # Metadata
+    meta = []
+    if content.published:
+        meta.append(f"Published: {content.published}")
+    if content.language and content.language != "English":
+        meta.append(f"Language: {content.language}")
+    if content.tags_preview:
+        meta.append(f"Tags: {content.tags_preview}")
+    if meta:
+        parts.append('<div class="column gap-1">')
+        parts.extend(f'<div class="text-xs text-gray-500">{escape(line)}</div>' for line in meta)
+        parts.append("</div>")
+    return "".join(parts)
+
+
+def _create_content_card(content: ContentSummary) -> None:
+    """Create a content display card."""
+    with ui.card().classes("p-4 shadow-lg hover:shadow-xl transition-shadow cursor-pointer"):
+        ui.html(_card_html(content)).classes("w-full")
+
+        # Action button
+        if content.id is not None:
+            ui.button(
+                "View Details", on_click=lambda content_id=content.id: ui.navigate.to(f"/content/{content_id}")
+            ).classes("w-full mt-3 bg-primary text-white")
+
+
+def _book_details(book: Book) -> List[str]:
+    """List the book-specific detail lines."""
+    details = []
+    if book.publisher:
+        details.append(f"Publisher: {book.publisher}")
+    if book.page_count:
+        details.append(f"Pages: {book.page_count}")
+    if book.edition:
+        details.append(f"Edition: {book.edition}")
+    if book.format:
+        details.append(f"Format: {book.format.title()}")
+
+    return details
+
+
+def _article_details(article: Article) -> List[str]:
+    """List the article-specific detail lines."""
+    details = []
+    if article.journal_name:
+        details.append(f"Journal: {article.journal_name}")
+    if article.volume:
+        details.append(f"Volume: {article.volume}")
+    if article.issue:
+        details.append(f"Issue: {article.issue}")
+    if article.page_range:
+        details.append(f"Pages: {article.page_range}")
+    if article.doi:
+        details.append(f"DOI: {article.doi}")
+
+    return details
+
+
+def _magazine_details(magazine: Magazine) -> List[str]:
+    """List the magazine-specific detail lines."""
+    details = []
+    if magazine.issue_number:
+        details.append(f"Issue: {magazine.issue_number}")
+    if magazine.frequency:
+        details.append(f"Frequency: {magazine.frequency.title()}")
+    if magazine.publisher:
+        details.append(f"Publisher: {magazine.publisher}")
+
+    return details
+
+
+def _multimedia_details(multimedia: Multimedia) -> List[str]:
+    """List the multimedia-specific detail lines."""
+    details = []
+    if multimedia.media_type:
+        details.append(f"Media Type: {multimedia.media_type.title()}")
+    if multimedia.duration_minutes:
+        hours = multimedia.duration_minutes // 60
+        minutes = multimedia.duration_minutes % 60
+        if hours > 0:
+            details.append(f"Duration: {hours}h {minutes}m")
+        else:
+            details.append(f"Duration: {minutes}m")
+    if multimedia.file_format:
+        details.append(f"Format: {multimedia.file_format.upper()}")
+    if multimedia.file_size_mb:
+        details.append(f"Size: {multimedia.file_size_mb} MB")
+
+    return details
+
+
+# Lists the type-specific information of each content type for the detail page
+_DETAIL_LINES: Mapping[ContentType, Callable[[Any], List[str]]] = MappingProxyType(
+    {
+        ContentType.BOOK: _book_details,
+        ContentType.ARTICLE: _article_details,
+        ContentType.MAGAZINE: _magazine_details,
+        ContentType.MULTIMEDIA: _multimedia_details,
+    }
+)
+
+
+class _CardGrid:
+    """Three-column grid of content cards keyed by content ID, so showing new results only builds the new cards.
+
+    Cards past the first screen are built once their placeholder slot scrolls into view.
+    """
+
+    def __init__(self) -> None:
+        self.grid = ui.grid(columns=3).classes("w-full gap-6")
+        # One slot element per shown result, holding its card or, until it is first seen, a placeholder
+        self.slots: Dict[int, ui.element] = {}
+        self.shown: Dict[int, ContentSummary] = {}
+        self.pending: Dict[int, ContentSummary] = {}
+        self.grid.on("slot_visible", self._render_slot)
+
+    async def show(self, results: List[ContentSummary]) -> None:
+        """Show results in order, keeping the cards of results that are already shown unchanged.
+
+        The first screen of cards is built in batches, yielding to the event loop between them.
+        """
+        current = {content.id: content for content in results}
+        for content_id in list(self.slots):
+            # A changed row (e.g. a new status) gets a fresh card
+            if current.get(content_id) != self.shown[content_id]:
+                self.slots.pop(content_id).delete()
+                del self.shown[content_id]
+                self.pending.pop(content_id, None)
+
+        for index, content in enumerate(results):
+            slot = self.slots.get(content.id)
+            if slot is None:
+                with self.grid:
+                    slot = ui.element("div").props(f"data-slot={content.id} data-pending").style(_SLOT_STYLE)
+                self.slots[content.id] = slot
+                self.shown[content.id] = content
+                self.pending[content.id] = content
+            if self.grid.default_slot.children[index] is not slot:
+                slot.move(self.grid, target_index=index)
+
+        if len(results) > _EAGER_CARDS:
+            ui.run_javascript(_OBSERVE_SLOTS_JS % {"grid_id": self.grid.id})
+        for index, content in enumerate(results[:_EAGER_CARDS]):
+            if index and index % _CARDS_PER_YIELD == 0:
+                # Let other clients' events run; a later show may have replaced these results meanwhile
+                await asyncio.sleep(0)
+            self._fill(content.id)
+
+    def _fill(self, content_id: int) -> None:
+        content = self.pending.pop(content_id, None)
+        if content is None:
+            return
+        slot = self.slots[content_id]
+        slot.props(remove="data-pending").style(remove=_SLOT_STYLE)
+        with slot:
+            _create_content_card(content)
+
+    def _render_slot(self, e: events.GenericEventArguments) -> None:
+        self._fill(int(e.args))
+
 
 def create():
     """Create the digital library application pages."""
@@ -23,7 +332,7 @@ def create():
     )
 
     @ui.page("/")
-    def home_page():
+    async def home_page():
         """Digital library home page with search and book display."""
 
         # Header
@@ -71,17 +380,33 @@ def create():
                         "bg-primary text-white"
                     )
 
-            # Results section
+            # Results section; the grid stays put between searches so shared results keep their cards
             results_container = ui.column().classes("w-full gap-4")
+            with results_container:
+                results_header = ui.column().classes("w-full gap-4")
+                result_grid = _CardGrid()
+                results_pager = ui.column().classes("w-full")
+            # Latest books until a search replaces them
+            result_pages = _ResultPages(ContentService.get_book_summaries)
 
             # Statistics section
             stats_container = ui.row().classes("w-full gap-4 mb-6")
 
-            def load_statistics():
+            # Placeholders hold the layout until the data loaded after the first paint replaces them
+            with results_header:
+                ui.skeleton().classes("w-64 h-7 mb-4")
+                with ui.grid(columns=3).classes("w-full gap-6"):
+                    for _ in range(_EAGER_CARDS):
+                        ui.skeleton().classes("h-64")
+            with stats_container:
+                for _ in range(4):
+                    ui.skeleton().classes("h-24 flex-1")
+
+            async def load_statistics():
                 """Load and display library statistics."""
                 try:
+                    counts = await run.io_bound(cached_get_available_content_count)
                     stats_container.clear()
-                    counts = ContentService.get_available_content_count()
 
                     with stats_container:
                         create_stat_card("📚 Books", str(counts.get(ContentType.BOOK, 0)), "Available for checkout")
@@ -94,7 +419,8 @@ def create():
                         )
 
                 except Exception as e:
-                    logger.error(f"Error loading statistics: {str(e)}")
+                    logger.error("Error loading statistics: %s", e, exc_info=True)
+                    stats_container.clear()
                     with stats_container:
                         ui.label(f"Error loading statistics: {str(e)}").classes("text-red-500")
 
@@ -105,34 +431,54 @@ def create():
                     ui.label(value).classes("text-3xl font-bold text-primary mt-2")
                     ui.label(subtitle).classes("text-sm text-gray-500 mt-1")
 
-            def perform_search():
+            async def perform_search():
                 """Perform content search and display results."""
                 try:
                     query = search_input.value or ""
                     content_type = None if content_type_select.value == "all" else content_type_select.value
 
-                    results = ContentService.search_content(
-                        query=query, content_type=content_type, available_only=True, limit=20
+                    result_pages.start(
+                        partial(
+                            ContentService.search_content_summaries,
+                            query=query,
+                            content_type=content_type,
+                            available_only=True,
+                        ),
+                        query,
                     )
+                    results = await result_pages.load()
+                    if results is not None:
+                        await display_search_results(results, query)
+
+                except Exception as e:
+                    logger.error("Search error: %s", e, exc_info=True)
+                    ui.notify(f"Search error: {str(e)}", type="negative")
 
-                    display_search_results(results, query)
+            async def turn_result_page(step: int):
+                """Show the previous or next page of the current results."""
+                try:
+                    result_pages.turn(step)
+                    results = await result_pages.load()
+                    if results is not None:
+                        await display_search_results(results, result_pages.query)
 
                 except Exception as e:
-                    logger.error(f"Search error: {str(e)}")
+                    logger.error("Search error: %s", e, exc_info=True)
                     ui.notify(f"Search error: {str(e)}", type="negative")
 
-            def display_search_results(results: List[Content], query: str):
+            async def display_search_results(results: List[ContentSummary], query: str):
                 """Display search results."""
-                results_container.clear()
+                results_header.clear()
+                results_pager.clear()
 
-                with results_container:
+                with results_header:
                     # Results header
                     if query:
-                        ui.label(f'Search Results for "{query}" ({len(results)} items found)').classes(
+                        ui.label(f'Search Results for "{query}" ({result_pages.describe(len(results))})').classes(
                             "text-xl font-semibold text-gray-800 mb-4"
                         )
                     else:
-                        ui.label(f"Latest Content ({len(results)} items)").classes(
+                        ui.label(f"Latest Content ({result_pages.describe(len(results))})").classes(
                             "text-xl font-semibold text-gray-800 mb-4"
                         )
 
@@ -141,80 +487,34 @@ def create():
                             ui.icon("search_off", size="48px").classes("text-gray-400 mb-4")
                             ui.label("No content found").classes("text-lg text-gray-500")
                             ui.label("Try adjusting your search terms or browse all content").classes("text-gray-400")
-                        return
-
-                    # Results grid
-                    with ui.grid(columns=3).classes("w-full gap-6"):
-                        for content in results:
-                            create_content_card(content)
-
-            def create_content_card(content: Content):
-                """Create a content display card."""
-                with ui.card().classes("p-4 shadow-lg hover:shadow-xl transition-shadow cursor-pointer"):
-                    # Content type badge
-                    type_colors = {
-                        ContentType.BOOK: "bg-blue-100 text-blue-800",
-                        ContentType.ARTICLE: "bg-green-100 text-green-800",
-                        ContentType.MAGAZINE: "bg-purple-100 text-purple-800",
-                        ContentType.MULTIMEDIA: "bg-orange-100 text-orange-800",
-                    }
-
-                    with ui.row().classes("justify-between items-start mb-3"):
-                        ui.label(content.content_type.value.title()).classes(
-                            f"px-2 py-1 rounded-full text-xs font-medium {type_colors.get(content.content_type, 'bg-gray-100 text-gray-800')}"
-                        )
-
-                        status_color = "text-green-500" if content.status == ContentStatus.AVAILABLE else "text-red-500"
-                        ui.label(content.status.value.replace("_", " ").title()).classes(f"text-xs {status_color}")
-
-                    # Title and description
-                    ui.label(content.title).classes("text-lg font-semibold text-gray-800 mb-2 line-clamp-2")
-
-                    if content.description:
-                        ui.label(content.description).classes("text-sm text-gray-600 mb-3 line-clamp-3")
 
-                    # Metadata
-                    with ui.column().classes("gap-1"):
-                        if content.publication_date:
-                            ui.label(f"Published: {content.publication_date.strftime('%Y-%m-%d')}").classes(
-                                "text-xs text-gray-500"
-                            )
+                # Results grid
+                await result_grid.show(results)
+                with results_pager:
+                    _render_pager(result_pages, turn_result_page)
 
-                        if content.language and content.language != "English":
-                            ui.label(f"Language: {content.language}").classes("text-xs text-gray-500")
-
-                        if content.tags:
-                            tags_str = ", ".join(content.tags[:3])  # Show first 3 tags
-                            if len(content.tags) > 3:
-                                tags_str += f" +{len(content.tags) - 3} more"
-                            ui.label(f"Tags: {tags_str}").classes("text-xs text-gray-500")
-
-                    # Action button
-                    if content.id is not None:
-                        ui.button(
-                            "View Details",
-                            on_click=lambda content_id=content.id: ui.navigate.to(f"/content/{content_id}"),
-                        ).classes("w-full mt-3 bg-primary text-white")
-
-            def load_initial_content():
+            async def load_initial_content():
                 """Load initial content (recent books) on page load."""
                 try:
-                    recent_books = ContentService.get_books(limit=12)
-                    display_search_results(recent_books, "")
+                    results = await result_pages.load()
+                    if results is not None:
+                        await display_search_results(results, "")
                 except Exception as e:
-                    logger.error(f"Error loading content: {str(e)}")
-                    with results_container:
+                    logger.error("Error loading content: %s", e, exc_info=True)
+                    results_header.clear()
+                    with results_header:
                         ui.label(f"Error loading content: {str(e)}").classes("text-red-500")
 
-            # Load initial data
-            load_statistics()
-            load_initial_content()
+            # Load initial data once the page is shown; both queries run in worker threads at the same time
+            ui.timer(0.01, load_statistics, once=True)
+            ui.timer(0.01, load_initial_content, once=True)
 
             # Allow search on Enter key
-            search_input.on("keydown.enter", perform_search)
+            # Only the last of quickly repeated Enter presses searches
+            search_input.on("keydown.enter", perform_search, throttle=0.2, leading_events=False)
 
     @ui.page("/content/{content_id}")
-    def content_detail_page(content_id: int):
+    async def content_detail_page(content_id: int):
         """Detailed view of a specific content item."""
 
         # Header
@@ -228,10 +528,10 @@ def create():
         with ui.column().classes("w-full max-w-4xl mx-auto p-6 gap-6"):
             content_container = ui.column().classes("w-full")
 
-            def load_content_details():
+            async def load_content_details():
                 """Load and display detailed content information."""
                 try:
-                    details = ContentService.get_content_with_details(content_id)
+                    details = await run.io_bound(cached_get_content_with_details, content_id)
                     if details is None:
                         with content_container:
                             ui.label("Content not found").classes("text-xl text-red-500")
@@ -250,19 +550,11 @@ def create():
                             with ui.row().classes("justify-between items-start mb-4"):
                                 ui.label(content.title).classes("text-3xl font-bold text-gray-800")
 
-                                status_colors = {
-                                    ContentStatus.AVAILABLE: "bg-green-100 text-green-800",
-                                    ContentStatus.CHECKED_OUT: "bg-red-100 text-red-800",
-                                    ContentStatus.RESERVED: "bg-yellow-100 text-yellow-800",
-                                    ContentStatus.MAINTENANCE: "bg-gray-100 text-gray-800",
-                                }
-                                ui.label(content.status.value.replace("_", " ").title()).classes(
-                                    f"px-3 py-1 rounded-full text-sm font-medium {status_colors.get(content.status, 'bg-gray-100 text-gray-800')}"
-                                )
+                                ui.label(_STATUS_LABELS[content.status]).classes(_STATUS_BADGE_CLASSES[content.status])
 
                             # Content type and basic info
                             with ui.row().classes("gap-4 mb-4"):
-                                ui.label(f"Type: {content.content_type.value.title()}").classes("text-lg text-gray-600")
+                                ui.label(f"Type: {_TYPE_LABELS[content.content_type]}").classes("text-lg text-gray-600")
                                 if content.language:
                                     ui.label(f"Language: {content.language}").classes("text-lg text-gray-600")
                                 if content.publication_date:
@@ -301,21 +593,15 @@ def create():
                                         ui.label(tag).classes("px-2 py-1 bg-gray-100 text-gray-700 rounded text-sm")
 
                         # Extended information based on content type
-                        if extended_info:
+                        detail_lines = _DETAIL_LINES[content.content_type](extended_info) if extended_info else []
+                        if detail_lines:
                             with ui.card().classes("w-full p-6"):
-                                ui.label(f"{content.content_type.value.title()} Details").classes(
+                                ui.label(f"{_TYPE_LABELS[content.content_type]} Details").classes(
                                     "text-xl font-semibold text-gray-800 mb-4"
                                 )
 
-                                match content.content_type:
-                                    case ContentType.BOOK:
-                                        display_book_details(extended_info)
-                                    case ContentType.ARTICLE:
-                                        display_article_details(extended_info)
-                                    case ContentType.MAGAZINE:
-                                        display_magazine_details(extended_info)
-                                    case ContentType.MULTIMEDIA:
-                                        display_multimedia_details(extended_info)
+                                for detail in detail_lines:
+                                    ui.label(detail).classes("text-gray-700 mb-1")
 
                         # Actions
                         with ui.card().classes("w-full p-6"):
@@ -327,80 +613,15 @@ def create():
                                 ui.button("Add Review", icon="rate_review").classes("bg-accent text-white")
 
                 except Exception as e:
-                    logger.error(f"Error loading content details: {str(e)}")
+                    logger.error("Error loading content details: %s", e, exc_info=True)
                     with content_container:
                         ui.label(f"Error loading content details: {str(e)}").classes("text-red-500 text-xl")
 
-            def display_book_details(book):
-                """Display book-specific details."""
-                details = []
-                if book.publisher:
-                    details.append(f"Publisher: {book.publisher}")
-                if book.page_count:
-                    details.append(f"Pages: {book.page_count}")
-                if book.edition:
-                    details.append(f"Edition: {book.edition}")
-                if book.format:
-                    details.append(f"Format: {book.format.title()}")
-
-                for detail in details:
-                    ui.label(detail).classes("text-gray-700 mb-1")
-
-            def display_article_details(article):
-                """Display article-specific details."""
-                details = []
-                if article.journal_name:
-                    details.append(f"Journal: {article.journal_name}")
-                if article.volume:
-                    details.append(f"Volume: {article.volume}")
-                if article.issue:
-                    details.append(f"Issue: {article.issue}")
-                if article.page_range:
-                    details.append(f"Pages: {article.page_range}")
-                if article.doi:
-                    details.append(f"DOI: {article.doi}")
-
-                for detail in details:
-                    ui.label(detail).classes("text-gray-700 mb-1")
-
-            def display_magazine_details(magazine):
-                """Display magazine-specific details."""
-                details = []
-                if magazine.issue_number:
-                    details.append(f"Issue: {magazine.issue_number}")
-                if magazine.frequency:
-                    details.append(f"Frequency: {magazine.frequency.title()}")
-                if magazine.publisher:
-                    details.append(f"Publisher: {magazine.publisher}")
-
-                for detail in details:
-                    ui.label(detail).classes("text-gray-700 mb-1")
-
-            def display_multimedia_details(multimedia):
-                """Display multimedia-specific details."""
-                details = []
-                if multimedia.media_type:
-                    details.append(f"Media Type: {multimedia.media_type.title()}")
-                if multimedia.duration_minutes:
-                    hours = multimedia.duration_minutes // 60
-                    minutes = multimedia.duration_minutes % 60
-                    if hours > 0:
-                        details.append(f"Duration: {hours}h {minutes}m")
-                    else:
-                        details.append(f"Duration: {minutes}m")
-                if multimedia.file_format:
-                    details.append(f"Format: {multimedia.file_format.upper()}")
-                if multimedia.file_size_mb:
-                    details.append(f"Size: {multimedia.file_size_mb} MB")
-
-                for detail in details:
-                    ui.label(detail).classes("text-gray-700 mb-1")
-
             # Load content details on page load
-            load_content_details()
+            await load_content_details()
 
     @ui.page("/browse")
-    def browse_page():
+    async def browse_page():
         """Browse all content with filters."""
 
         # Header
@@ -437,82 +658,64 @@ def create():
                         "bg-primary text-white"
                     )
 
-            # Results
-            browse_results = ui.column().classes("w-full gap-4")
+            # Results; the grid stays put between filter changes so shared results keep their cards
+            with ui.column().classes("w-full gap-4"):
+                browse_header = ui.column().classes("w-full gap-4")
+                browse_grid = _CardGrid()
+                browse_pager = ui.column().classes("w-full")
+            browse_pages = _ResultPages(ContentService.search_content_summaries)
 
-            def apply_filters():
+            async def apply_filters():
                 """Apply filters and display results."""
                 try:
                     content_type = None if content_type_filter.value == "all" else content_type_filter.value
                     available_only = status_filter.value == "available"
 
-                    results = ContentService.search_content(
-                        query="", content_type=content_type, available_only=available_only, limit=50
+                    browse_pages.start(
+                        partial(
+                            ContentService.search_content_summaries,
+                            query="",
+                            content_type=content_type,
+                            available_only=available_only,
+                        )
                     )
-
-                    browse_results.clear()
-
-                    with browse_results:
-                        ui.label(f"Found {len(results)} items").classes("text-lg font-semibold text-gray-800 mb-4")
-
-                        if results:
-                            with ui.grid(columns=3).classes("w-full gap-6"):
-                                for content in results:
-                                    create_content_card(content)
-                        else:
-                            with ui.card().classes("p-6 text-center"):
-                                ui.label("No content found with current filters").classes("text-lg text-gray-500")
+                    results = await browse_pages.load()
+                    if results is not None:
+                        await show_browse_results(results)
 
                 except Exception as e:
-                    logger.error(f"Filter error: {str(e)}")
+                    logger.error("Filter error: %s", e, exc_info=True)
                     ui.notify(f"Filter error: {str(e)}", type="negative")
 
-            # Load initial browse results
-            apply_filters()
-
-    def create_content_card(content: Content):
-        """Create a content display card (shared function)."""
-        with ui.card().classes("p-4 shadow-lg hover:shadow-xl transition-shadow cursor-pointer"):
-            # Content type badge
-            type_colors = {
-                ContentType.BOOK: "bg-blue-100 text-blue-800",
-                ContentType.ARTICLE: "bg-green-100 text-green-800",
-                ContentType.MAGAZINE: "bg-purple-100 text-purple-800",
-                ContentType.MULTIMEDIA: "bg-orange-100 text-orange-800",
-            }
-
-            with ui.row().classes("justify-between items-start mb-3"):
-                ui.label(content.content_type.value.title()).classes(
-                    f"px-2 py-1 rounded-full text-xs font-medium {type_colors.get(content.content_type, 'bg-gray-100 text-gray-800')}"
-                )
-
-                status_color = "text-green-500" if content.status == ContentStatus.AVAILABLE else "text-red-500"
-                ui.label(content.status.value.replace("_", " ").title()).classes(f"text-xs {status_color}")
+            async def turn_browse_page(step: int):
+                """Show the previous or next page of the filtered content."""
+                try:
+                    browse_pages.turn(step)
+                    results = await browse_pages.load()
+                    if results is not None:
+                        await show_browse_results(results)
 
-            # Title and description
-            ui.label(content.title).classes("text-lg font-semibold text-gray-800 mb-2 line-clamp-2")
+                except Exception as e:
+                    logger.error("Filter error: %s", e, exc_info=True)
+                    ui.notify(f"Filter error: {str(e)}", type="negative")
 
-            if content.description:
-                ui.label(content.description).classes("text-sm text-gray-600 mb-3 line-clamp-3")
+            async def show_browse_results(results: List[ContentSummary]):
+                """Display one page of browse results."""
+                browse_header.clear()
+                browse_pager.clear()
 
-            # Metadata
-            with ui.column().classes("gap-1"):
-                if content.publication_date:
-                    ui.label(f"Published: {content.publication_date.strftime('%Y-%m-%d')}").classes(
-                        "text-xs text-gray-500"
+                with browse_header:
+                    ui.label(f"Showing {browse_pages.describe(len(results))}").classes(
+                        "text-lg font-semibold text-gray-800 mb-4"
                     )
 
-                if content.language and content.language != "English":
-                    ui.label(f"Language: {content.language}").classes("text-xs text-gray-500")
+                    if not results:
+                        with ui.card().classes("p-6 text-center"):
+                            ui.label("No content found with current filters").classes("text-lg text-gray-500")
 
-                if content.tags:
-                    tags_str = ", ".join(content.tags[:3])
-                    if len(content.tags) > 3:
-                        tags_str += f" +{len(content.tags) - 3} more"
-                    ui.label(f"Tags: {tags_str}").classes("text-xs text-gray-500")
+                await browse_grid.show(results)
+                with browse_pager:
+                    _render_pager(browse_pages, turn_browse_page)
 
-            # Action button
-            if content.id is not None:
-                ui.button(
-                    "View Details", on_click=lambda content_id=content.id: ui.navigate.to(f"/content/{content_id}")
-                ).classes("w-full mt-3 bg-primary text-white")
+            # Load initial browse results
+            await apply_filters()
@@ -1,10 +1,55 @@
 from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlalchemy import DDL, DateTime, Index, event, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from decimal import Decimal
 
 
+def _trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index that lets Postgres serve ILIKE '%q%' lookups on column; skipped on other databases."""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}).ddl_if(
+        dialect="postgresql"
+    )
+
+
+# The trigram operator classes come from the pg_trgm extension, which must exist before the indexes are created
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class _utc_now(FunctionElement):
+    """Naive UTC timestamp of the database clock."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_utc_now)
+def _compile_utc_now(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(_utc_now, "sqlite")
+def _compile_utc_now_sqlite(element, compiler, **kw):
+    # Same text layout as the datetimes SQLAlchemy binds, so stored values keep comparing correctly as strings
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+def _timestamp_field(on_update: bool = False) -> Any:
+    """Timestamp set by the database when the row is inserted and, with on_update, on every ORM update."""
+    kwargs: Dict[str, Any] = {"server_default": _utc_now()}
+    if on_update:
+        kwargs["onupdate"] = _utc_now()
+    # None only until the row is inserted; the column itself is never NULL
+    return Field(default=None, nullable=False, sa_column_kwargs=kwargs)
+
+
 class ContentType(str, Enum):
     """Content type enumeration for different media types."""
 
@@ -28,6 +73,8 @@ class ContentAuthor(SQLModel, table=True):
     """Junction table for content-author relationships."""
 
     __tablename__ = "content_authors"  # type: ignore[assignment]
+    # The primary key already leads with content_id; this serves lookups from the author side
+    __table_args__ = (Index("content_authors_author_id_idx", "author_id"),)
 
     content_id: int = Field(foreign_key="content.id", primary_key=True)
     author_id: int = Field(foreign_key="authors.id", primary_key=True)
@@ -37,6 +84,8 @@ class ContentCategory(SQLModel, table=True):
     """Junction table for content-category relationships."""
 
     __tablename__ = "content_categories"  # type: ignore[assignment]
+    # The primary key already leads with content_id; this serves lookups from the category side
+    __table_args__ = (Index("content_categories_category_id_idx", "category_id"),)
 
     content_id: int = Field(foreign_key="content.id", primary_key=True)
     category_id: int = Field(foreign_key="categories.id", primary_key=True)
@@ -54,13 +103,15 @@ class User(SQLModel, table=True):
     last_name: str = Field(max_length=100)
     is_active: bool = Field(default=True)
     is_staff: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _timestamp_field()
+    updated_at: Optional[datetime] = _timestamp_field(on_update=True)
 
     # Relationships
-    checkouts: List["Checkout"] = Relationship(back_populates="user")
-    reservations: List["Reservation"] = Relationship(back_populates="user")
-    reviews: List["Review"] = Relationship(back_populates="user")
+    checkouts: List["Checkout"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    reservations: List["Reservation"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    reviews: List["Review"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 # Content models
@@ -68,6 +119,27 @@ class Content(SQLModel, table=True):
     """Base content model for all library items."""
 
     __tablename__ = "content"  # type: ignore[assignment]
+    __table_args__ = (
+        _trigram_index("content_title_trgm", "title"),
+        _trigram_index("content_description_trgm", "description"),
+        # Full text search over title and description; must match the document searched by the content service
+        Index(
+            "content_search_fts",
+            text("to_tsvector('english', title || ' ' || description)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        # Serves the newest-first (created_at, id) ordering and created_at cutoffs
+        Index("content_created_idx", "created_at", "id"),
+        # Type and status filtered listings read newest first, and the per-type available counts
+        Index("content_type_status_created_idx", "content_type", "status", "created_at", "id"),
+        # Available-only listings read just the rows available to borrow
+        Index(
+            "content_available_created_idx",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'AVAILABLE'"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=500)
@@ -77,19 +149,33 @@ class Content(SQLModel, table=True):
     isbn: Optional[str] = Field(default=None, max_length=20)
     language: str = Field(default="English", max_length=50)
     publication_date: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _timestamp_field()
+    updated_at: Optional[datetime] = _timestamp_field(on_update=True)
     tags: List[str] = Field(default=[], sa_column=Column(JSON))
     content_metadata: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
 
     # Relationships
-    checkouts: List["Checkout"] = Relationship(back_populates="content")
-    reservations: List["Reservation"] = Relationship(back_populates="content")
-    reviews: List["Review"] = Relationship(back_populates="content")
-    book: Optional["Book"] = Relationship(back_populates="content")
-    article: Optional["Article"] = Relationship(back_populates="content")
-    magazine: Optional["Magazine"] = Relationship(back_populates="content")
-    multimedia: Optional["Multimedia"] = Relationship(back_populates="content")
+    checkouts: List["Checkout"] = Relationship(
+        back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    reservations: List["Reservation"] = Relationship(
+        back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    reviews: List["Review"] = Relationship(back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    authors: List["Author"] = Relationship(link_model=ContentAuthor, sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    categories: List["Category"] = Relationship(
+        link_model=ContentCategory, sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    book: Optional["Book"] = Relationship(back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    article: Optional["Article"] = Relationship(
+        back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    magazine: Optional["Magazine"] = Relationship(
+        back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    multimedia: Optional["Multimedia"] = Relationship(
+        back_populates="content", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
 
 
 class Book(SQLModel, table=True):
@@ -105,7 +191,7 @@ class Book(SQLModel, table=True):
     format: str = Field(default="paperback", max_length=50)  # paperback, hardcover, ebook, audiobook
 
     # Relationship
-    content: Content = Relationship(back_populates="book")
+    content: Content = Relationship(back_populates="book", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 class Article(SQLModel, table=True):
@@ -122,7 +208,7 @@ class Article(SQLModel, table=True):
     doi: Optional[str] = Field(default=None, max_length=100)
 
     # Relationship
-    content: Content = Relationship(back_populates="article")
+    content: Content = Relationship(back_populates="article", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 class Magazine(SQLModel, table=True):
@@ -137,7 +223,7 @@ class Magazine(SQLModel, table=True):
     publisher: str = Field(default="", max_length=200)
 
     # Relationship
-    content: Content = Relationship(back_populates="magazine")
+    content: Content = Relationship(back_populates="magazine", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 class Multimedia(SQLModel, table=True):
@@ -153,7 +239,7 @@ class Multimedia(SQLModel, table=True):
     file_size_mb: Optional[Decimal] = Field(default=None, decimal_places=2)
 
     # Relationship
-    content: Content = Relationship(back_populates="multimedia")
+    content: Content = Relationship(back_populates="multimedia", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 # Author and Category models
@@ -161,6 +247,12 @@ class Author(SQLModel, table=True):
     """Author model for content creators."""
 
     __tablename__ = "authors"  # type: ignore[assignment]
+    __table_args__ = (
+        _trigram_index("authors_first_name_trgm", "first_name"),
+        _trigram_index("authors_last_name_trgm", "last_name"),
+        # The author list and its pages read in (last_name, first_name, id) order
+        Index("authors_name_idx", "last_name", "first_name", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     first_name: str = Field(max_length=100)
@@ -174,6 +266,13 @@ class Category(SQLModel, table=True):
     """Category model for content classification."""
 
     __tablename__ = "categories"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("categories_parent_id_idx", "parent_id"),
+        # Root categories in name order, as listed by get_root_categories
+        Index("categories_root_name_idx", "name", postgresql_where=text("parent_id IS NULL")).ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(unique=True, max_length=100)
@@ -182,9 +281,9 @@ class Category(SQLModel, table=True):
 
     # Relationships
     parent: Optional["Category"] = Relationship(
-        back_populates="children", sa_relationship_kwargs={"remote_side": "Category.id"}
+        back_populates="children", sa_relationship_kwargs={"remote_side": "Category.id", "lazy": "raise_on_sql"}
     )
-    children: List["Category"] = Relationship(back_populates="parent")
+    children: List["Category"] = Relationship(back_populates="parent", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 # Library operations models
@@ -192,54 +291,69 @@ class Checkout(SQLModel, table=True):
     """Checkout model for tracking borrowed items."""
 
     __tablename__ = "checkouts"  # type: ignore[assignment]
+    # A user's open or returned checkouts, and the checkouts of one item
+    __table_args__ = (
+        Index("checkouts_user_id_returned_idx", "user_id", "is_returned"),
+        Index("checkouts_content_id_idx", "content_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
     content_id: int = Field(foreign_key="content.id")
-    checkout_date: datetime = Field(default_factory=datetime.utcnow)
+    checkout_date: Optional[datetime] = _timestamp_field()
     due_date: datetime
     return_date: Optional[datetime] = Field(default=None)
     is_returned: bool = Field(default=False)
     fine_amount: Decimal = Field(default=Decimal("0.00"), decimal_places=2)
 
     # Relationships
-    user: User = Relationship(back_populates="checkouts")
-    content: Content = Relationship(back_populates="checkouts")
+    user: User = Relationship(back_populates="checkouts", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    content: Content = Relationship(back_populates="checkouts", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 class Reservation(SQLModel, table=True):
     """Reservation model for holding items."""
 
     __tablename__ = "reservations"  # type: ignore[assignment]
+    # A user's active reservations, and the reservations queued for one item
+    __table_args__ = (
+        Index("reservations_user_id_active_idx", "user_id", "is_active"),
+        Index("reservations_content_id_idx", "content_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
     content_id: int = Field(foreign_key="content.id")
-    reservation_date: datetime = Field(default_factory=datetime.utcnow)
+    reservation_date: Optional[datetime] = _timestamp_field()
     expiry_date: datetime
     is_active: bool = Field(default=True)
 
     # Relationships
-    user: User = Relationship(back_populates="reservations")
-    content: Content = Relationship(back_populates="reservations")
+    user: User = Relationship(back_populates="reservations", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    content: Content = Relationship(back_populates="reservations", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 class Review(SQLModel, table=True):
     """Review model for user content ratings and comments."""
 
     __tablename__ = "reviews"  # type: ignore[assignment]
+    # The reviews of one item, and those written by one user
+    __table_args__ = (
+        Index("reviews_content_id_idx", "content_id"),
+        Index("reviews_user_id_idx", "user_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
     content_id: int = Field(foreign_key="content.id")
     rating: int = Field(ge=1, le=5)  # 1-5 star rating
     comment: str = Field(default="", max_length=1000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _timestamp_field()
+    updated_at: Optional[datetime] = _timestamp_field(on_update=True)
 
     # Relationships
-    user: User = Relationship(back_populates="reviews")
-    content: Content = Relationship(back_populates="reviews")
+    user: User = Relationship(back_populates="reviews", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    content: Content = Relationship(back_populates="reviews", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 # Non-persistent schemas for validation and API
@@ -294,6 +408,15 @@ class BookCreate(SQLModel, table=False):
     format: str = Field(default="paperback", max_length=50)
 
 
+class BookImport(SQLModel, table=False):
+    """Schema for one book of a bulk import."""
+
+    content: ContentCreate
+    book: BookCreate = Field(default_factory=BookCreate)
+    author_ids: List[int] = Field(default=[])
+    category_ids: List[int] = Field(default=[])
+
+
 class AuthorCreate(SQLModel, table=False):
     """Schema for creating new authors."""
 
@@ -1,7 +1,5 @@
 from app.database import create_tables
 from app.sample_data import initialize_sample_data_if_needed
-import app.digital_library
-import app.content_management
 
 
 def startup() -> None:
@@ -11,6 +9,9 @@ def startup() -> None:
     # Initialize sample data if database is empty
     initialize_sample_data_if_needed()
 
-    # Initialize all application modules
+    # Initialize all application modules; the UI modules are imported only when the pages are built
+    import app.digital_library
+    import app.content_management
+
     app.digital_library.create()
     app.content_management.create()
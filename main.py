@@ -1,6 +1,7 @@
 import logging
 import os
 from app.startup import startup
+from app.content_service_cache import cache_stats
 from nicegui import app, ui
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -26,6 +27,11 @@ async def health():
     return {"status": "healthy", "service": "nicegui-app"}
 
 
+@app.get("/debug/cache")
+async def debug_cache():
+    return cache_stats()
+
+
 # suppress sqlalchemy engine logs below warning level
 logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
 
@@ -1,7 +1,22 @@
-from typing import Generator
-import pytest
-from app.startup import startup
-from nicegui.testing import User
+import os
+from typing import Any, Callable, Generator, List
+
+# Unless pointed at a server, run the suite on an in-memory SQLite database that the pooled connections share,
+# one per pytest-xdist worker so `pytest -n auto` runs need no coordination; set before app.database builds ENGINE
+os.environ.setdefault(
+    "APP_DATABASE_URL",
+    f"sqlite:///file:library_tests_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}?mode=memory&cache=shared&uri=true",
+)
+
+import pytest  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from app import database  # noqa: E402
+from app.content_service import ContentService  # noqa: E402
+from app.database import ENGINE, reset_db  # noqa: E402
+from app.models import BookImport, Content, ContentCreate, ContentType  # noqa: E402
+from app.startup import startup  # noqa: E402
+from nicegui.testing import User  # noqa: E402
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
@@ -10,3 +25,58 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture(scope="session")
+def db_schema() -> Generator[None, None, None]:
+    """Create empty tables once for the whole test session."""
+    reset_db()
+    yield
+
+
+@pytest.fixture
+def fresh_db(db_schema: None) -> Generator[None, None, None]:
+    """Run the test inside one transaction that is rolled back afterwards, leaving the tables empty again.
+
+    Every service call shares a session bound to that transaction; their commits only release savepoints.
+    """
+    with ENGINE.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        token = database._scoped_session.set(session)
+        try:
+            yield
+        finally:
+            database._scoped_session.reset(token)
+            session.close()
+            transaction.rollback()
+
+
+@pytest.fixture
+def book_factory(fresh_db: None) -> Callable[..., List[Content]]:
+    """Create plain books, one per title and all with the same content fields, in a single bulk import."""
+
+    def make(*titles: str, **fields: Any) -> List[Content]:
+        return ContentService.create_books(
+            [
+                BookImport(content=ContentCreate(title=title, content_type=ContentType.BOOK, **fields))
+                for title in titles
+            ]
+        )
+
+    return make
+
+
+@pytest.fixture
+def sql_statements() -> Generator[List[str], None, None]:
+    """Collect every SQL statement sent to the database, to guard against N+1 lazy loads."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # fresh_db wraps every commit in a savepoint, and SQLite transactions begin explicitly; neither is a query
+        if not statement.startswith(("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    yield statements
+    event.remove(ENGINE, "before_cursor_execute", record)
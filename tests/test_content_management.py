@@ -0,0 +1,55 @@
+from typing import Generator, List
+
+import pytest
+from nicegui import ui
+from nicegui.testing import User
+
+from app.content_service import AuthorService, CategoryService
+from app.database import reset_db
+
+
+@pytest.fixture
+def empty_db(user: User) -> Generator[None, None, None]:
+    """Empty the tables the user fixture's startup seeded, and again once the page test is done."""
+    reset_db()
+    yield
+    reset_db()
+
+
+def _card_titles(user: User) -> List[str]:
+    """Card titles of every html chunk on the page, in grid order."""
+    chunks = [element for element in user.client.elements.values() if isinstance(element, ui.html)]
+    return [
+        part.split("</div>", 1)[0]
+        for chunk in chunks
+        for part in chunk.content.split('<div class="text-lg font-semibold text-gray-800">')[1:]
+    ]
+
+
+async def test_new_author_shown_in_sorted_position(user: User, empty_db):
+    """Test that an author sorting before the loaded ones is shown in place, not appended at the end."""
+    AuthorService.create_author("Ann", "Adams")
+    AuthorService.create_author("Carl", "Clark")
+    await user.open("/manage-authors")
+    await user.should_see("All Authors (2)")
+
+    user.find("First Name").type("Bea")
+    user.find("Last Name").type("Brown")
+    user.find("Add Author").click()
+    await user.should_see("All Authors (3)")
+
+    assert _card_titles(user) == ["Ann Adams", "Bea Brown", "Carl Clark"]
+
+
+async def test_new_category_shown_in_sorted_position(user: User, empty_db):
+    """Test that a category sorting before the loaded ones is shown in place, not appended at the end."""
+    CategoryService.create_category("Fiction")
+    CategoryService.create_category("Poetry")
+    await user.open("/manage-categories")
+    await user.should_see("All Categories (2)")
+
+    user.find("Category Name").type("History")
+    user.find("Add Category").click()
+    await user.should_see("All Categories (3)")
+
+    assert _card_titles(user) == ["Fiction", "History", "Poetry"]
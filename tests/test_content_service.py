@@ -1,16 +1,20 @@
+from datetime import datetime, timedelta
+
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 
-from app.database import reset_db
+from app.database import get_session, session_scope
 from app.content_service import ContentService, AuthorService, CategoryService
-from app.models import Content, ContentType, ContentStatus, ContentCreate, BookCreate
-
-
-@pytest.fixture()
-def fresh_db():
-    """Provide a fresh database for each test."""
-    reset_db()
-    yield
-    reset_db()
+from app.models import (
+    AuthorCreate,
+    BookCreate,
+    BookImport,
+    CategoryCreate,
+    Content,
+    ContentCreate,
+    ContentStatus,
+    ContentType,
+)
 
 
 class TestContentService:
@@ -29,32 +33,23 @@ class TestContentService:
         assert len(results) == 1
         assert results[0].title == "Test Book"
 
-    def test_search_content_by_title(self, fresh_db):
-        """Test searching content by title."""
-        # Create test books
-        book1_data = ContentCreate(title="Python Programming", content_type=ContentType.BOOK)
-        book2_data = ContentCreate(title="Java Development", content_type=ContentType.BOOK)
-
-        ContentService.create_book(book1_data, BookCreate())
-        ContentService.create_book(book2_data, BookCreate())
-
-        # Search for Python
-        results = ContentService.search_content(query="Python")
+    @pytest.mark.parametrize(
+        "title,description,query",
+        [
+            ("Python Programming", "", "Python"),
+            ("Programming Book", "Learn advanced Python techniques", "advanced"),
+            ("PYTHON Programming", "", "python"),
+        ],
+        ids=["title", "description", "case_insensitive"],
+    )
+    def test_search_content_matches(self, fresh_db, book_factory, title, description, query):
+        """Test that search matches title or description, ignoring case."""
+        book_factory(title, description=description)
+        book_factory("Java Development")
 
-        assert len(results) == 1
-        assert results[0].title == "Python Programming"
-
-    def test_search_content_by_description(self, fresh_db):
-        """Test searching content by description."""
-        content_data = ContentCreate(
-            title="Programming Book", description="Learn advanced Python techniques", content_type=ContentType.BOOK
-        )
-        ContentService.create_book(content_data, BookCreate())
+        results = ContentService.search_content(query=query)
 
-        results = ContentService.search_content(query="advanced")
-
-        assert len(results) == 1
-        assert results[0].description == "Learn advanced Python techniques"
+        assert [content.title for content in results] == [title]
 
     def test_search_content_by_tags(self, fresh_db):
         """Test that content has tags (tags are not searchable in current implementation)."""
@@ -67,16 +62,6 @@ class TestContentService:
         assert created_book is not None
         assert "beginner" in created_book.tags
 
-    def test_search_content_case_insensitive(self, fresh_db):
-        """Test that search is case insensitive."""
-        content_data = ContentCreate(title="PYTHON Programming", content_type=ContentType.BOOK)
-        ContentService.create_book(content_data, BookCreate())
-
-        results = ContentService.search_content(query="python")
-
-        assert len(results) == 1
-        assert results[0].title == "PYTHON Programming"
-
     def test_search_content_by_type(self, fresh_db):
         """Test filtering content by type."""
         book_data = ContentCreate(title="Test Book", content_type=ContentType.BOOK)
@@ -84,7 +69,6 @@ class TestContentService:
 
         ContentService.create_book(book_data, BookCreate())
         # For article, we need to create content directly since we don't have create_article method
-        from app.database import get_session
 
         with get_session() as session:
             article = Content(**article_data.model_dump())
@@ -99,8 +83,6 @@ class TestContentService:
 
     def test_search_available_only(self, fresh_db):
         """Test filtering by availability status."""
-        from app.database import get_session
-
         # Create available content
         available_data = ContentCreate(title="Available Book", content_type=ContentType.BOOK)
         ContentService.create_book(available_data, BookCreate())
@@ -121,8 +103,6 @@ class TestContentService:
 
     def test_search_all_status(self, fresh_db):
         """Test searching all content regardless of status."""
-        from app.database import get_session
-
         # Create content with different statuses
         available_data = ContentCreate(title="Available Book", content_type=ContentType.BOOK)
         ContentService.create_book(available_data, BookCreate())
@@ -139,16 +119,215 @@ class TestContentService:
 
         assert len(results) == 2
 
-    def test_search_content_limit(self, fresh_db):
-        """Test search limit parameter."""
-        # Create multiple books
+    @pytest.mark.parametrize(
+        "fetch", [ContentService.search_content, ContentService.get_books], ids=["search", "books"]
+    )
+    @pytest.mark.parametrize("limit", [3, 5])
+    def test_content_limit(self, fresh_db, book_factory, fetch, limit):
+        """Test that listings return at most limit rows."""
+        book_factory(*(f"Book {i}" for i in range(6)))
+
+        assert len(fetch(limit=limit)) == limit
+
+    def test_search_content_cursor_pagination(self, fresh_db, book_factory):
+        """Test paging through search results with keyset cursors."""
+        book_factory(*(f"Book {i}" for i in range(5)))
+
+        titles = []
+        cursor = None
+        while True:
+            page = ContentService.search_content(limit=2, cursor=cursor)
+            titles.extend(content.title for content in page)
+            token = ContentService.next_cursor(page, limit=2)
+            if token is None:
+                break
+            cursor = ContentService.decode_cursor(token)
+
+        assert sorted(titles) == [f"Book {i}" for i in range(5)]
+
+    def test_get_recent_content_cursor(self, fresh_db, book_factory):
+        """Test that a cursor continues recent content after the previous page."""
+        book_factory(*(f"Book {i}" for i in range(3)))
+
+        first_page = ContentService.get_recent_content(limit=2)
+        token = ContentService.next_cursor(first_page, limit=2)
+        assert token is not None
+
+        second_page = ContentService.get_recent_content(limit=2, cursor=ContentService.decode_cursor(token))
+
+        assert len(second_page) == 1
+        assert second_page[0].id not in {content.id for content in first_page}
+
+    def test_get_recent_content_excludes_old(self, fresh_db, book_factory):
+        """Test that content created before the cutoff is not recent."""
+        [old] = book_factory("Old Book")
+        book_factory("New Book")
+        assert old is not None and old.id is not None
+
+        with get_session() as session:
+            stored = session.get(Content, old.id)
+            assert stored is not None
+            stored.created_at = datetime.utcnow() - timedelta(days=40)
+            session.add(stored)
+            session.commit()
+
+        recent = ContentService.get_recent_content(days=30)
+
+        assert [content.title for content in recent] == ["New Book"]
+
+    def test_get_books_with_details_query_count(self, fresh_db, sql_statements):
+        """Test that book details take the same number of queries however many books there are."""
+        author = AuthorService.create_author("John", "Doe")
+        category = CategoryService.create_category("Fiction")
+        assert author.id is not None and category.id is not None
         for i in range(5):
-            content_data = ContentCreate(title=f"Book {i}", content_type=ContentType.BOOK)
-            ContentService.create_book(content_data, BookCreate())
+            ContentService.create_book(
+                ContentCreate(title=f"Book {i}", content_type=ContentType.BOOK),
+                BookCreate(),
+                [author.id],
+                [category.id],
+            )
+        sql_statements.clear()
+
+        books = ContentService.get_books_with_details()
+
+        assert len(books) == 5
+        assert all(book["authors"][0].last_name == "Doe" for book in books)
+        assert len(sql_statements) == 3
+
+    def test_get_content_with_details_query_count(self, fresh_db, sql_statements):
+        """Test that content details load authors, categories and extended info in one query."""
+        authors = [AuthorService.create_author(f"Author{i}", "Doe") for i in range(3)]
+        categories = [CategoryService.create_category(name) for name in ("Fiction", "History")]
+        book = ContentService.create_book(
+            ContentCreate(title="Detailed", content_type=ContentType.BOOK),
+            BookCreate(),
+            [author.id for author in authors if author.id is not None],
+            [category.id for category in categories if category.id is not None],
+        )
+        assert book is not None and book.id is not None
+        sql_statements.clear()
+
+        details = ContentService.get_content_with_details(book.id)
+
+        assert details is not None
+        assert len(details["authors"]) == 3
+        assert len(details["categories"]) == 2
+        assert len(sql_statements) == 1
+
+    def test_unloaded_relationships_raise(self, fresh_db, book_factory):
+        """Test that relationships not loaded up front raise instead of lazily querying."""
+        [content] = book_factory("Test Book")
+        assert content is not None and content.id is not None
+
+        with session_scope():
+            loaded = ContentService.get_content_by_id(content.id)
+            assert loaded is not None
+            with pytest.raises(InvalidRequestError):
+                _ = loaded.authors
+
+    def test_create_books_in_import_order(self, fresh_db):
+        """Test that a bulk import creates every book with its links, in order."""
+        author = AuthorService.create_author("John", "Doe")
+        category = CategoryService.create_category("Fiction")
+        assert author.id is not None and category.id is not None
+
+        books = ContentService.create_books(
+            [
+                BookImport(
+                    content=ContentCreate(title=f"Imported {i}", content_type=ContentType.BOOK),
+                    book=BookCreate(page_count=100 + i),
+                    author_ids=[author.id],
+                    category_ids=[category.id] if i % 2 == 0 else [],
+                )
+                for i in range(4)
+            ]
+        )
 
-        results = ContentService.search_content(limit=3)
+        assert [book.title for book in books] == [f"Imported {i}" for i in range(4)]
+        assert all(book.id is not None for book in books)
+        details = ContentService.get_content_with_details(books[3].id or 0)
+        assert details is not None
+        assert details["extended_info"].page_count == 103
+        assert [a.last_name for a in details["authors"]] == ["Doe"]
+        assert details["categories"] == []
+        assert len(ContentService.batch_get_categories([book.id or 0 for book in books])[books[2].id or 0]) == 1
 
-        assert len(results) == 3
+    def test_has_books(self, fresh_db, book_factory):
+        """Test that has_books reports whether any book exists."""
+        assert not ContentService.has_books()
+        book_factory("Book")
+        assert ContentService.has_books()
+
+    def test_create_books_empty(self, fresh_db):
+        """Test that an empty import creates nothing."""
+        assert ContentService.create_books([]) == []
+
+    def test_search_content_summaries(self, fresh_db, book_factory):
+        """Test that summary results carry the card fields."""
+        book_factory("Summary Book", tags=["classic"])
+
+        results = ContentService.search_content_summaries()
+
+        assert len(results) == 1
+        assert results[0].title == "Summary Book"
+        assert results[0].tags_preview == "classic"
+        assert results[0].status == ContentStatus.AVAILABLE
+
+    def test_search_content_summaries_filters_and_cursor(self, fresh_db, book_factory):
+        """Test that summary search applies the search filters and continues after a cursor."""
+        book_factory(*(f"Python {i}" for i in range(3)), "Other")
+
+        first_page = ContentService.search_content_summaries(query="python", limit=2)
+        token = ContentService.next_cursor(first_page, limit=2)
+        assert token is not None
+        second_page = ContentService.search_content_summaries(
+            query="python", limit=2, cursor=ContentService.decode_cursor(token)
+        )
+
+        titles = [row.title for row in first_page + second_page]
+        assert sorted(titles) == ["Python 0", "Python 1", "Python 2"]
+
+    def test_get_book_summaries(self, fresh_db, book_factory):
+        """Test that book summaries list books only, newest first."""
+        book_factory("Book")
+
+        summaries = ContentService.get_book_summaries(limit=5)
+
+        assert [row.title for row in summaries] == ["Book"]
+        assert summaries[0].content_type == ContentType.BOOK
+        assert summaries[0].published is None
+
+    def test_summaries_preview_tags(self, fresh_db, book_factory):
+        """Test that summaries carry the first three tags and a count of the rest."""
+        book_factory("Few", tags=["a", "b"])
+        book_factory("Many", tags=["d", "c", "b", "a", "e"])
+        book_factory("None", tags=[])
+
+        previews = {row.title: row.tags_preview for row in ContentService.search_content_summaries()}
+
+        assert previews == {"Few": "a, b", "Many": "d, c, b +2 more", "None": None}
+
+    def test_summaries_format_publication_date(self, fresh_db):
+        """Test that summaries carry the publication date formatted for display."""
+        ContentService.create_book(
+            ContentCreate(title="Dated", content_type=ContentType.BOOK, publication_date=datetime(1949, 6, 8, 12, 30)),
+            BookCreate(),
+        )
+
+        assert ContentService.search_content_summaries()[0].published == "1949-06-08"
+
+    def test_get_book_summaries_cursor(self, fresh_db, book_factory):
+        """Test that book summaries continue after the cursor of the previous page."""
+        book_factory(*(f"Book {i}" for i in range(3)))
+
+        first_page = ContentService.get_book_summaries(limit=2)
+        token = ContentService.next_cursor(first_page, limit=2)
+        assert token is not None
+        second_page = ContentService.get_book_summaries(limit=2, cursor=ContentService.decode_cursor(token))
+
+        assert sorted(row.title for row in first_page + second_page) == ["Book 0", "Book 1", "Book 2"]
+        assert ContentService.next_cursor(second_page, limit=2) is None
 
     def test_get_content_by_id_exists(self, fresh_db):
         """Test getting content by ID when it exists."""
@@ -173,8 +352,6 @@ class TestContentService:
         book_data = ContentCreate(title="Test Book", content_type=ContentType.BOOK)
         ContentService.create_book(book_data, BookCreate())
 
-        from app.database import get_session
-
         with get_session() as session:
             article = Content(title="Test Article", content_type=ContentType.ARTICLE)
             session.add(article)
@@ -185,16 +362,23 @@ class TestContentService:
         assert len(books) == 1
         assert books[0].content_type == ContentType.BOOK
 
-    def test_get_books_limit(self, fresh_db):
-        """Test getting books with limit."""
-        # Create multiple books
-        for i in range(5):
-            content_data = ContentCreate(title=f"Book {i}", content_type=ContentType.BOOK)
-            ContentService.create_book(content_data, BookCreate())
+    def test_get_books_loads_book_details(self, fresh_db, sql_statements):
+        """Test that books come with their book-specific information from the same query."""
+        ContentService.create_books(
+            [
+                BookImport(
+                    content=ContentCreate(title=f"Book {i}", content_type=ContentType.BOOK),
+                    book=BookCreate(page_count=100 + i),
+                )
+                for i in range(3)
+            ]
+        )
+        sql_statements.clear()
 
-        books = ContentService.get_books(limit=3)
+        books = ContentService.get_books()
 
-        assert len(books) == 3
+        assert sorted(book.book.page_count for book in books if book.book is not None) == [100, 101, 102]
+        assert len(sql_statements) == 1
 
     def test_create_book_success(self, fresh_db):
         """Test successful book creation."""
@@ -263,6 +447,20 @@ class TestContentService:
             assert updated_content is not None
             assert updated_content.status == ContentStatus.CHECKED_OUT
 
+    def test_timestamps_set_by_database(self, fresh_db, book_factory):
+        """Test that the database stamps new rows and bumps updated_at on status updates."""
+        [content] = book_factory("Test Book")
+        assert content is not None and content.id is not None
+        assert content.created_at is not None
+        assert content.updated_at == content.created_at
+
+        ContentService.update_content_status(content.id, ContentStatus.RESERVED)
+
+        updated_content = ContentService.get_content_by_id(content.id)
+        assert updated_content is not None
+        assert updated_content.created_at == content.created_at
+        assert updated_content.updated_at >= content.updated_at
+
     def test_update_content_status_not_found(self, fresh_db):
         """Test updating status of non-existent content."""
         result = ContentService.update_content_status(999, ContentStatus.CHECKED_OUT)
@@ -275,8 +473,6 @@ class TestContentService:
         book_data = ContentCreate(title="Test Book", content_type=ContentType.BOOK)
         ContentService.create_book(book_data, BookCreate())
 
-        from app.database import get_session
-
         with get_session() as session:
             article = Content(title="Test Article", content_type=ContentType.ARTICLE)
             session.add(article)
@@ -313,6 +509,61 @@ class TestContentService:
             assert details["extended_info"] is not None
             assert details["extended_info"].publisher == "Test Publisher"
 
+    def test_batch_get_authors(self, fresh_db):
+        """Test getting authors for several content items at once."""
+        doe = AuthorService.create_author("John", "Doe")
+        smith = AuthorService.create_author("Jane", "Smith")
+        book_data = BookCreate()
+
+        first = ContentService.create_book(
+            ContentCreate(title="First", content_type=ContentType.BOOK), book_data, [smith.id, doe.id]
+        )
+        second = ContentService.create_book(ContentCreate(title="Second", content_type=ContentType.BOOK), book_data)
+
+        if first and first.id is not None and second and second.id is not None:
+            authors = ContentService.batch_get_authors([first.id, second.id])
+
+            assert [author.last_name for author in authors[first.id]] == ["Doe", "Smith"]
+            assert authors[second.id] == []
+
+    def test_batch_get_categories_empty_ids(self, fresh_db):
+        """Test batch category lookup without content IDs."""
+        assert ContentService.batch_get_categories([]) == {}
+
+    def test_get_books_with_details(self, fresh_db, book_factory):
+        """Test getting books with their authors and categories."""
+        author = AuthorService.create_author("Test", "Author")
+        category = CategoryService.create_category("Fiction")
+        content = ContentService.create_book(
+            ContentCreate(title="Detailed Book", content_type=ContentType.BOOK),
+            BookCreate(),
+            [author.id],
+            [category.id],
+        )
+        book_factory("Plain Book")
+
+        results = ContentService.get_books_with_details()
+
+        assert len(results) == 2
+        detailed = next(result for result in results if content and result["content"].id == content.id)
+        assert [a.last_name for a in detailed["authors"]] == ["Author"]
+        assert [c.name for c in detailed["categories"]] == ["Fiction"]
+
+    def test_session_scope_shares_session(self, fresh_db, book_factory):
+        """Test that service calls inside session_scope reuse one session."""
+        [content] = book_factory("Scoped Book")
+
+        if content and content.id is not None:
+            with session_scope() as session:
+                first = ContentService.get_content_by_id(content.id)
+                second = ContentService.get_content_by_id(content.id)
+
+                assert first is second
+                assert first in session
+
+            # Loaded attributes stay readable once the scope has closed the session
+            assert first is not None and first.title == "Scoped Book"
+
     def test_get_content_with_details_not_found(self, fresh_db):
         """Test getting details for non-existent content."""
         details = ContentService.get_content_with_details(999)
@@ -332,6 +583,16 @@ class TestAuthorService:
         assert author.biography == "A test author"
         assert author.id is not None
 
+    def test_create_authors_in_order(self, fresh_db):
+        """Test that a batch of authors is created in the order given."""
+        authors = AuthorService.create_authors(
+            [AuthorCreate(first_name=f"First {i}", last_name=f"Last {i}") for i in range(5)]
+        )
+
+        assert [author.last_name for author in authors] == [f"Last {i}" for i in range(5)]
+        assert len({author.id for author in authors}) == 5
+        assert AuthorService.create_authors([]) == []
+
     def test_create_author_minimal(self, fresh_db):
         """Test creating author with minimal required fields."""
         author = AuthorService.create_author("Jane", "Smith")
@@ -342,6 +603,14 @@ class TestAuthorService:
         assert author.birth_date is None
         assert author.website is None
 
+    def test_create_author_bumps_version(self, fresh_db):
+        """Test that creating an author changes the author version."""
+        version = AuthorService.get_version()
+
+        AuthorService.create_author("John", "Doe")
+
+        assert AuthorService.get_version() > version
+
     def test_get_all_authors_empty(self, fresh_db):
         """Test getting all authors when none exist."""
         authors = AuthorService.get_all_authors()
@@ -360,25 +629,19 @@ class TestAuthorService:
         assert authors[0].last_name == "Doe"
         assert authors[1].last_name == "Smith"
 
-    def test_search_authors_by_first_name(self, fresh_db):
-        """Test searching authors by first name."""
+    @pytest.mark.parametrize(
+        "query,expected_last_name",
+        [("John", "Doe"), ("Smith", "Smith"), ("john", "Doe")],
+        ids=["first_name", "last_name", "case_insensitive"],
+    )
+    def test_search_authors_matches(self, fresh_db, query, expected_last_name):
+        """Test that author search matches first or last name, ignoring case."""
         AuthorService.create_author("John", "Doe")
         AuthorService.create_author("Jane", "Smith")
 
-        results = AuthorService.search_authors("John")
-
-        assert len(results) == 1
-        assert results[0].first_name == "John"
-
-    def test_search_authors_by_last_name(self, fresh_db):
-        """Test searching authors by last name."""
-        AuthorService.create_author("John", "Doe")
-        AuthorService.create_author("Jane", "Smith")
+        results = AuthorService.search_authors(query)
 
-        results = AuthorService.search_authors("Smith")
-
-        assert len(results) == 1
-        assert results[0].last_name == "Smith"
+        assert [author.last_name for author in results] == [expected_last_name]
 
     def test_search_authors_partial_match(self, fresh_db):
         """Test searching authors with partial matches."""
@@ -390,15 +653,6 @@ class TestAuthorService:
         # Should match both "Johnson" and "John"
         assert len(results) == 2
 
-    def test_search_authors_case_insensitive(self, fresh_db):
-        """Test that author search is case insensitive."""
-        AuthorService.create_author("John", "Doe")
-
-        results = AuthorService.search_authors("john")
-
-        assert len(results) == 1
-        assert results[0].first_name == "John"
-
     def test_search_authors_no_results(self, fresh_db):
         """Test searching authors with no matches."""
         AuthorService.create_author("John", "Doe")
@@ -407,6 +661,35 @@ class TestAuthorService:
 
         assert len(results) == 0
 
+    def test_search_authors_limit(self, fresh_db):
+        """Test author search result limit."""
+        for i in range(5):
+            AuthorService.create_author(f"John{i}", "Doe")
+
+        results = AuthorService.search_authors("John", limit=3)
+
+        assert len(results) == 3
+
+    def test_get_authors_page(self, fresh_db):
+        """Test paging through authors in name order."""
+        for last_name in ["Evans", "Brown", "Clark", "Adams", "Davis"]:
+            AuthorService.create_author("John", last_name)
+
+        first_page = AuthorService.get_authors_page(offset=0, limit=2)
+        last_page = AuthorService.get_authors_page(offset=4, limit=2)
+
+        assert [author.last_name for author in first_page] == ["Adams", "Brown"]
+        assert [author.last_name for author in last_page] == ["Evans"]
+
+    def test_count_authors(self, fresh_db):
+        """Test counting authors."""
+        assert AuthorService.count_authors() == 0
+
+        AuthorService.create_author("John", "Doe")
+        AuthorService.create_author("Jane", "Smith")
+
+        assert AuthorService.count_authors() == 2
+
 
 class TestCategoryService:
     """Test the CategoryService class."""
@@ -420,6 +703,20 @@ class TestCategoryService:
         assert category.parent_id is None
         assert category.id is not None
 
+    def test_create_categories_in_order(self, fresh_db):
+        """Test that a batch of categories is created in the order given."""
+        fiction = CategoryService.create_category("Fiction")
+
+        categories = CategoryService.create_categories(
+            [CategoryCreate(name="Mystery", parent_id=fiction.id), CategoryCreate(name="Biography")]
+        )
+
+        assert [(category.name, category.parent_id) for category in categories] == [
+            ("Mystery", fiction.id),
+            ("Biography", None),
+        ]
+        assert CategoryService.create_categories([]) == []
+
     def test_create_category_minimal(self, fresh_db):
         """Test creating category with minimal fields."""
         category = CategoryService.create_category("Mystery")
@@ -468,3 +765,32 @@ class TestCategoryService:
         assert len(root_categories) == 2
         for category in root_categories:
             assert category.parent_id is None
+
+    def test_search_categories(self, fresh_db):
+        """Test searching categories by name."""
+        CategoryService.create_category("Science Fiction")
+        CategoryService.create_category("Science")
+        CategoryService.create_category("History")
+
+        results = CategoryService.search_categories("science")
+
+        assert [category.name for category in results] == ["Science", "Science Fiction"]
+
+    def test_search_categories_limit(self, fresh_db):
+        """Test category search result limit."""
+        for i in range(5):
+            CategoryService.create_category(f"Category {i}")
+
+        results = CategoryService.search_categories("Category", limit=2)
+
+        assert len(results) == 2
+
+    def test_get_categories_page(self, fresh_db):
+        """Test paging through categories in name order."""
+        for name in ["History", "Fiction", "Science"]:
+            CategoryService.create_category(name)
+
+        results = CategoryService.get_categories_page(offset=1, limit=5)
+
+        assert [category.name for category in results] == ["History", "Science"]
+        assert CategoryService.count_categories() == 3
@@ -0,0 +1,147 @@
+from app.content_service import AuthorService, CategoryService, ContentService
+from app.content_service_cache import (
+    cache_stats,
+    cached_count_authors,
+    cached_count_categories,
+    cached_get_all_categories,
+    cached_get_authors_page,
+    cached_get_available_content_count,
+    cached_get_categories_page,
+    cached_get_content_with_details,
+    cached_get_root_categories,
+)
+from app.models import ContentStatus, ContentType
+
+
+def test_cached_authors_page_reuse_result(fresh_db):
+    """Test that repeated reads are served from the cache."""
+    AuthorService.create_author("John", "Doe")
+
+    first = cached_get_authors_page(0, 10)
+    second = cached_get_authors_page(0, 10)
+
+    assert [author.model_dump() for author in first] == [author.model_dump() for author in second]
+    assert first[0] is not second[0]
+
+
+def test_cached_authors_page_not_shared(fresh_db):
+    """Test that changing an author from one cached page does not leak into the next read."""
+    AuthorService.create_author("John", "Doe")
+
+    cached_get_authors_page(0, 10)[0].last_name = "Changed"
+
+    assert [author.last_name for author in cached_get_authors_page(0, 10)] == ["Doe"]
+
+
+def test_cached_authors_invalidated_on_create(fresh_db):
+    """Test that creating an author invalidates the cached page and count."""
+    AuthorService.create_author("John", "Doe")
+    assert len(cached_get_authors_page(0, 10)) == 1
+    assert cached_count_authors() == 1
+
+    AuthorService.create_author("Jane", "Smith")
+
+    assert [author.last_name for author in cached_get_authors_page(0, 10)] == ["Doe", "Smith"]
+    assert cached_count_authors() == 2
+
+
+def test_cached_categories_invalidated_on_create(fresh_db):
+    """Test that creating a category invalidates the cached page and count."""
+    CategoryService.create_category("Fiction")
+    assert len(cached_get_categories_page(0, 10)) == 1
+    assert cached_count_categories() == 1
+
+    CategoryService.create_category("History")
+
+    assert [category.name for category in cached_get_categories_page(0, 10)] == ["Fiction", "History"]
+    assert cached_count_categories() == 2
+
+
+def test_cached_all_and_root_categories_invalidated_on_create(fresh_db):
+    """Test that creating a category invalidates the cached category lists."""
+    fiction = CategoryService.create_category("Fiction")
+    assert [category.name for category in cached_get_all_categories()] == ["Fiction"]
+    assert [category.name for category in cached_get_root_categories()] == ["Fiction"]
+
+    CategoryService.create_category("Mystery", parent_id=fiction.id)
+
+    assert [category.name for category in cached_get_all_categories()] == ["Fiction", "Mystery"]
+    assert [category.name for category in cached_get_root_categories()] == ["Fiction"]
+
+
+def test_cached_categories_served_from_cache(fresh_db):
+    """Test that category lists are read once until a category is created, and never share objects."""
+    CategoryService.create_category("Fiction")
+
+    first = cached_get_all_categories()
+    before = cache_stats()["all_categories"]
+    first[0].name = "Changed"
+    second = cached_get_all_categories()
+
+    assert isinstance(second, tuple)
+    assert [category.name for category in second] == ["Fiction"]
+    assert cache_stats()["all_categories"]["hits"] == before["hits"] + 1
+    CategoryService.create_category("History")
+    assert [category.name for category in cached_get_all_categories()] == ["Fiction", "History"]
+
+
+def test_cached_available_content_count_invalidated_on_writes(fresh_db, book_factory):
+    """Test that creating a book or changing its status invalidates the cached counts."""
+    assert cached_get_available_content_count()[ContentType.BOOK] == 0
+
+    [book] = book_factory("Counted")
+    assert book is not None and book.id is not None
+    assert cached_get_available_content_count()[ContentType.BOOK] == 1
+
+    ContentService.update_content_status(book.id, ContentStatus.CHECKED_OUT)
+
+    assert cached_get_available_content_count()[ContentType.BOOK] == 0
+
+
+def test_cache_stats_count_hits_and_misses(fresh_db):
+    """Test that cache stats report the hits and misses of a cache."""
+    before = cache_stats()["available_content_count"]
+
+    cached_get_available_content_count()
+    cached_get_available_content_count()
+
+    after = cache_stats()["available_content_count"]
+    assert after["misses"] - before["misses"] <= 1
+    assert after["hits"] + after["misses"] - before["hits"] - before["misses"] == 2
+
+
+def test_cached_content_details_invalidated_on_status_change(fresh_db, book_factory):
+    """Test that content details are cached until the content changes."""
+    [book] = book_factory("Cached")
+    assert book is not None and book.id is not None
+
+    first = cached_get_content_with_details(book.id)
+    second = cached_get_content_with_details(book.id)
+    assert first is not None and second is not None
+    assert first["content"] is not second["content"]
+    assert first["content"].model_dump() == second["content"].model_dump()
+    assert cached_get_content_with_details(book.id + 1) is None
+
+    ContentService.update_content_status(book.id, ContentStatus.CHECKED_OUT)
+
+    updated = cached_get_content_with_details(book.id)
+    assert updated is not None
+    assert updated["content"].status == ContentStatus.CHECKED_OUT
+
+
+def test_cached_content_details_are_not_shared(fresh_db, book_factory):
+    """Test that changing one caller's cached details does not leak into the next caller's."""
+    [book] = book_factory("Cached", tags=["classic"])
+    assert book is not None and book.id is not None
+
+    first = cached_get_content_with_details(book.id)
+    assert first is not None
+    first["content"].status = ContentStatus.MAINTENANCE
+    first["content"].tags.append("changed")
+    first["extended_info"].publisher = "Changed"
+
+    second = cached_get_content_with_details(book.id)
+    assert second is not None
+    assert second["content"].status == ContentStatus.AVAILABLE
+    assert second["content"].tags == ["classic"]
+    assert second["extended_info"].publisher != "Changed"
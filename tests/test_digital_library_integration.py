@@ -1,15 +1,5 @@
-import pytest
-from app.database import reset_db
 from app.content_service import ContentService
-from app.models import ContentCreate, BookCreate, ContentType
-
-
-@pytest.fixture()
-def fresh_db():
-    """Provide a fresh database for each test."""
-    reset_db()
-    yield
-    reset_db()
+from app.models import ContentCreate, BookCreate, BookImport, ContentType
 
 
 class TestDigitalLibraryIntegration:
@@ -92,9 +82,9 @@ class TestDigitalLibraryIntegration:
     def test_get_books_functionality(self, fresh_db):
         """Test getting books specifically."""
         # Create books
-        for i in range(3):
-            content_data = ContentCreate(title=f"Book {i + 1}", content_type=ContentType.BOOK)
-            ContentService.create_book(content_data, BookCreate())
+        ContentService.create_books(
+            [BookImport(content=ContentCreate(title=f"Book {i + 1}", content_type=ContentType.BOOK)) for i in range(3)]
+        )
 
         books = ContentService.get_books()
 
@@ -120,9 +110,9 @@ class TestDigitalLibraryIntegration:
     def test_search_limit(self, fresh_db):
         """Test search limit functionality."""
         # Create multiple books
-        for i in range(10):
-            content_data = ContentCreate(title=f"Book {i + 1}", content_type=ContentType.BOOK)
-            ContentService.create_book(content_data, BookCreate())
+        ContentService.create_books(
+            [BookImport(content=ContentCreate(title=f"Book {i + 1}", content_type=ContentType.BOOK)) for i in range(10)]
+        )
 
         # Test limit
         limited_results = ContentService.search_content(limit=5)
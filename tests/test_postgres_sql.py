@@ -0,0 +1,101 @@
+"""The Postgres-only SQL of the app, compiled offline, plus checks that need a live Postgres database.
+
+The live checks run when APP_DATABASE_URL points at a Postgres database and are skipped otherwise.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlmodel import col
+
+from app.content_service import (
+    ContentService,
+    _SEARCH_DOCUMENT,
+    _full_text_match,
+    _iso_date,
+    _tags_preview,
+    _utc_days_ago,
+)
+from app.database import ENGINE, _missing_server_default_ddl
+from app.models import Content
+
+requires_postgres = pytest.mark.skipif(ENGINE.dialect.name != "postgresql", reason="needs a Postgres database")
+
+
+def _postgres_sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _content_index(name: str):
+    return next(index for index in Content.__table__.indexes if index.name == name)  # type: ignore[attr-defined]
+
+
+def test_full_text_match_sql():
+    sql = _postgres_sql(_full_text_match(_SEARCH_DOCUMENT, "robots"))
+    assert sql == (
+        "to_tsvector('english', content.title || ' ' || content.description)"
+        " @@ websearch_to_tsquery('english', 'robots')"
+    )
+
+
+@pytest.mark.skipif(ENGINE.dialect.name == "postgresql", reason="full text search is available")
+def test_full_text_match_is_false_without_postgres():
+    assert str(_full_text_match(_SEARCH_DOCUMENT, "robots").compile(dialect=ENGINE.dialect)) == "1 = 0"
+
+
+def test_search_document_matches_fts_index():
+    index_sql = str(CreateIndex(_content_index("content_search_fts")).compile(dialect=postgresql.dialect()))
+    assert "USING gin" in index_sql
+    assert "to_tsvector('english', title || ' ' || description)" in index_sql
+    assert "content.title || ' ' || content.description" in _postgres_sql(_SEARCH_DOCUMENT)
+
+
+def test_summary_column_functions_sql():
+    assert _postgres_sql(_iso_date(col(Content.publication_date))) == (
+        "to_char(content.publication_date, 'YYYY-MM-DD')"
+    )
+    assert _postgres_sql(_utc_days_ago(7)) == "timezone('utc', now()) - make_interval(days => 7)"
+    tags_sql = _postgres_sql(_tags_preview(col(Content.tags)))
+    assert "string_agg(tag, ', ' ORDER BY position)" in tags_sql
+    assert "json_array_elements_text(content.tags) WITH ORDINALITY" in tags_sql
+    assert "json_array_length(content.tags) > 3" in tags_sql
+
+
+def test_postgres_only_indexes_ddl():
+    dialect = postgresql.dialect()
+    trigram_sql = str(CreateIndex(_content_index("content_title_trgm")).compile(dialect=dialect))
+    assert trigram_sql == "CREATE INDEX content_title_trgm ON content USING gin (title gin_trgm_ops)"
+    available_sql = str(CreateIndex(_content_index("content_available_created_idx")).compile(dialect=dialect))
+    assert available_sql.endswith("(created_at, id) WHERE status = 'AVAILABLE'")
+
+
+def test_timestamp_server_defaults_ddl():
+    table_sql = str(CreateTable(Content.__table__).compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+    assert "created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT timezone('utc', now()) NOT NULL" in table_sql
+
+
+def test_missing_server_defaults_are_added():
+    existing = {"id": "nextval('content_id_seq'::regclass)", "title": None, "created_at": None, "updated_at": None}
+    existing_with_default = {**existing, "updated_at": "timezone('utc'::text, now())"}
+    table = Content.__table__  # type: ignore[attr-defined]
+
+    assert _missing_server_default_ddl(postgresql.dialect(), table, existing) == [
+        "ALTER TABLE content ALTER COLUMN created_at SET DEFAULT timezone('utc', now())",
+        "ALTER TABLE content ALTER COLUMN updated_at SET DEFAULT timezone('utc', now())",
+    ]
+    # Columns that already have a default or do not exist yet are left alone
+    assert _missing_server_default_ddl(postgresql.dialect(), table, existing_with_default) == [
+        "ALTER TABLE content ALTER COLUMN created_at SET DEFAULT timezone('utc', now())",
+    ]
+
+
+@requires_postgres
+def test_search_finds_other_word_forms(book_factory):
+    (content,) = book_factory("Public Libraries", description="Reading rooms")
+
+    results = ContentService.search_content("library")
+    assert [result.id for result in results] == [content.id]
+
+    summaries = ContentService.search_content_summaries("library")
+    assert [summary.id for summary in summaries] == [content.id]
+    assert summaries[0].published is None
@@ -1,17 +1,7 @@
-import pytest
-from app.database import reset_db
 from app.content_service import ContentService, AuthorService, CategoryService
 from app.models import ContentCreate, BookCreate, ContentType
 
 
-@pytest.fixture()
-def fresh_db():
-    """Provide a fresh database for each test."""
-    reset_db()
-    yield
-    reset_db()
-
-
 def test_digital_library_smoke(fresh_db):
     """Simple smoke test for digital library functionality."""
     # Test author creation
@@ -76,3 +66,26 @@ def test_database_operations():
     # Test session creation
     with get_session() as session:
         assert session is not None
+
+
+def test_create_tables_runs_once(db_schema, sql_statements):
+    """Test that create_tables skips the schema check once the tables exist."""
+    from app.database import create_tables
+
+    create_tables()
+    create_tables()
+
+    assert sql_statements == []
+
+
+def test_create_sample_data_is_all_or_nothing(fresh_db):
+    """Test that a failed seed leaves no authors or categories behind to block the next one."""
+    from app.sample_data import create_sample_data, has_sample_data
+
+    # Clashes with a sample category name, so the seed fails after its authors are inserted
+    CategoryService.create_category("Fiction")
+
+    assert create_sample_data() is None
+    assert AuthorService.get_all_authors() == []
+    assert [category.name for category in CategoryService.get_all_categories()] == ["Fiction"]
+    assert not has_sample_data()